@@ -0,0 +1,7 @@
+"""
+Reference implementations and grading tools for the practice problems.
+
+The practice-problem files under ``materials/`` are student skeletons. The
+modules in this package hold the reference answers the grader compares
+submissions against, written to cope with grading-sized inputs.
+"""
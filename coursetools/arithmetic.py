@@ -0,0 +1,489 @@
+"""
+Reference answers for perform_arithmetic_operations and divide_numbers in
+practice-problems-1.py, plus batch versions for generating reference
+answers over millions of pairs.
+
+The exercise returns one five-key dict per pair, which at scale costs far
+more in dict and float objects than in arithmetic.
+perform_arithmetic_operations_batch returns an ArithmeticColumns instead:
+one contiguous array per operation, filled a chunk at a time. Division and
+modulus by zero are masked (``np.ma.MaskedArray``) rather than raised, and
+``%`` keeps Python's sign semantics (the result takes the divisor's sign).
+ArithmeticColumns.rows gives the old per-pair dicts lazily, for code that
+still wants them.
+
+divide_numbers_batch is the bulk form of divide_numbers. Instead of one
+ZeroDivisionError per call, a zero_divisor policy decides what zero
+divisors do: "raise" reports the first offending index, "nan" gives the
+IEEE result (inf, -inf or NaN) and "mask" masks them. divide_csv applies
+it to the (a, b) pairs of a CSV file a chunk of rows at a time.
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from coursetools.arrays import as_array, batch_dtype
+
+# Pairs computed per step in perform_arithmetic_operations_batch.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Rows parsed per step in iter_csv_pairs and divide_csv.
+DEFAULT_CSV_ROWS = 1 << 18
+
+OPERATIONS = ("addition", "subtraction", "multiplication", "division", "modulus")
+
+# What divide_numbers_batch does with a zero divisor.
+ZERO_DIVISOR_POLICIES = ("raise", "nan", "mask")
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def divide_numbers(num1: float, num2: float) -> float:
+    """
+    Calculate and return the result of dividing first number by second number.
+
+    Args:
+        num1 (float): Dividend (number to be divided)
+        num2 (float): Divisor (number to divide by)
+
+    Returns:
+        float: Result of division
+
+    Raises:
+        ZeroDivisionError: If num2 is zero
+    """
+    if num2 == 0:
+        raise ZeroDivisionError("Cannot divide by zero")
+    return num1 / num2
+
+
+def perform_arithmetic_operations(num1: float, num2: float) -> dict[str, float]:
+    """
+    Perform basic arithmetic operations on two numbers.
+
+    Args:
+        num1 (float): First number
+        num2 (float): Second number
+
+    Returns:
+        dict[str, float]: Dictionary containing results of:
+            - addition
+            - subtraction
+            - multiplication
+            - division
+            - modulus
+
+    Example:
+        Input: 25, 4
+        Output: {
+            'addition': 29,
+            'subtraction': 21,
+            'multiplication': 100,
+            'division': 6.25,
+            'modulus': 1
+        }
+    """
+    return {
+        "addition": num1 + num2,
+        "subtraction": num1 - num2,
+        "multiplication": num1 * num2,
+        "division": num1 / num2,
+        "modulus": num1 % num2,
+    }
+
+
+class ArithmeticColumns(NamedTuple):
+    """The five results for many pairs, one array per operation."""
+
+    addition: np.ndarray
+    subtraction: np.ndarray
+    multiplication: np.ndarray
+    division: np.ma.MaskedArray  # masked where the divisor is zero
+    modulus: np.ma.MaskedArray  # masked where the divisor is zero
+
+    @property
+    def zero_divisor(self) -> np.ndarray:
+        """Boolean array, True for pairs whose divisor is zero."""
+        return np.ma.getmaskarray(self.division)
+
+    @property
+    def rows(self) -> "ArithmeticRows":
+        """Lazy per-pair dicts, as perform_arithmetic_operations returns."""
+        return ArithmeticRows(self)
+
+
+class ArithmeticRows(Sequence):
+    """
+    Read-only sequence of per-pair result dicts over an ArithmeticColumns.
+
+    Each dict is built when it is accessed. Masked division and modulus
+    results come out as None.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: ArithmeticColumns):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns.addition)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArithmeticRows(ArithmeticColumns(*(column[index] for column in self.columns)))
+        return {name: _scalar(column[index]) for name, column in zip(OPERATIONS, self.columns)}
+
+
+def _scalar(value: Any) -> Optional[float]:
+    if value is np.ma.masked:
+        return None
+    # Object columns (results past int64) already hold Python ints.
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def perform_arithmetic_operations_batch(
+    num1: Any,
+    num2: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ArithmeticColumns:
+    """
+    Add, subtract, multiply, divide and take the modulus of many pairs at once.
+
+    Example:
+        Input: [25, 7], [4, 0]
+        Output: ArithmeticColumns(addition=array([29, 7]),
+                                  subtraction=array([21, 7]),
+                                  multiplication=array([100, 0]),
+                                  division=masked_array([6.25, --]),
+                                  modulus=masked_array([1, --]))
+
+    Args:
+        num1: First numbers (list, array.array, NumPy array or buffer)
+        num2: Second numbers, same length as the first
+        chunk_size: Pairs computed per step
+
+    Returns:
+        ArithmeticColumns; division is floating point (true division).
+        The other columns have the inputs' common dtype, except that any
+        mix of integer inputs gives int64 columns (uint64 when both are
+        unsigned) and a column whose results do not fit is an object array
+        of Python ints, as perform_arithmetic_operations would return them.
+        uint64 values past int64 mixed with signed ints make every column
+        but division an object array
+
+    Raises:
+        ValueError: If the inputs have different lengths
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    left = as_array(num1)
+    right = as_array(num2)
+    if len(left) != len(right):
+        raise ValueError(f"arrays have different lengths: {len(left)} and {len(right)}")
+    # Any mix of ints (bools add as Python's do) is computed in int64, or
+    # uint64 when both are unsigned.
+    dtype = batch_dtype(left, right)
+    if dtype == np.int64 and any(_exceeds_int64(array) for array in (left, right)):
+        # Such uint64 values would wrap on the way in; use Python ints.
+        dtype = np.dtype(object)
+    exact = dtype == object
+    length = len(left)
+    addition = np.empty(length, dtype=dtype)
+    subtraction = np.empty(length, dtype=dtype)
+    multiplication = np.empty(length, dtype=dtype)
+    division = np.empty(length, dtype=np.float64 if exact else np.promote_types(dtype, np.float64))
+    modulus = np.empty(length, dtype=dtype)
+    zero = np.empty(length, dtype=bool)
+    overflowed = set()
+
+    # inf * 0 and the like give NaN quietly, as Python floats do.
+    with np.errstate(over="ignore", invalid="ignore", under="ignore"):
+        for start in range(0, length, chunk_size):
+            part = slice(start, start + chunk_size)
+            a, b = left[part].astype(dtype, copy=False), right[part].astype(dtype, copy=False)
+            np.add(a, b, out=addition[part])
+            np.subtract(a, b, out=subtraction[part])
+            np.multiply(a, b, out=multiplication[part])
+            if dtype.kind in "iu":
+                overflowed.update(_int_overflows(a, b, addition[part], subtraction[part]))
+            np.equal(b, 0, out=zero[part])
+            # Divide by 1 where the divisor is zero; those results are masked.
+            divisor = np.where(zero[part], 1, b).astype(dtype, copy=False)
+            if exact:
+                # Python ints divide to Python floats, which fill float64 as is.
+                division[part] = np.true_divide(a, divisor)
+            else:
+                np.true_divide(a, divisor, out=division[part])
+            # np.remainder gives the result the divisor's sign, like Python's %.
+            np.remainder(a, divisor, out=modulus[part])
+
+    if overflowed:
+        exact_left, exact_right = left.astype(object), right.astype(object)
+        if "addition" in overflowed:
+            addition = exact_left + exact_right
+        if "subtraction" in overflowed:
+            subtraction = exact_left - exact_right
+        if "multiplication" in overflowed:
+            multiplication = exact_left * exact_right
+
+    return ArithmeticColumns(
+        addition,
+        subtraction,
+        multiplication,
+        np.ma.MaskedArray(division, mask=zero),
+        np.ma.MaskedArray(modulus, mask=zero.copy()),
+    )
+
+
+def _exceeds_int64(array: np.ndarray) -> bool:
+    return array.dtype == np.uint64 and len(array) > 0 and int(array.max()) > np.iinfo(np.int64).max
+
+
+def _int_overflows(a: np.ndarray, b: np.ndarray, total: np.ndarray, difference: np.ndarray) -> List[str]:
+    """Which of a + b, a - b and a * b wrapped around for some pair."""
+    overflowed = []
+    if a.dtype.kind == "u":
+        if (total < a).any():
+            overflowed.append("addition")
+        if (a < b).any():  # negative differences
+            overflowed.append("subtraction")
+    else:
+        # A sum (or difference) overflowed where its sign differs from both
+        # operands' (from a's, and not b's).
+        if (((a ^ total) & (b ^ total)) < 0).any():
+            overflowed.append("addition")
+        if (((a ^ b) & (a ^ difference)) < 0).any():
+            overflowed.append("subtraction")
+    # Products have no cheap exact test; estimate them in float64, leaving
+    # headroom for its rounding.
+    product = np.abs(a.astype(np.float64)) * np.abs(b.astype(np.float64))
+    if (product >= float(np.iinfo(a.dtype).max) / 2).any():
+        overflowed.append("multiplication")
+    return overflowed
+
+
+def divide_numbers_batch(
+    num1: Any,
+    num2: Any,
+    zero_divisor: str = "raise",
+    offset: int = 0,
+) -> np.ndarray:
+    """
+    Divide many pairs at once, with true-division semantics for any dtype.
+
+    Example:
+        Input: [1, 3, -4, 0], [2, 0, 0, 0], zero_divisor="nan"
+        Output: array([0.5, inf, -inf, nan])
+
+    Args:
+        num1: Dividends (list, array.array, NumPy array or buffer)
+        num2: Divisors, same length as the dividends
+        zero_divisor: "raise", "nan" or "mask" (see ZERO_DIVISOR_POLICIES)
+        offset: Added to the index reported by "raise", for chunked input
+
+    Returns:
+        Floating-point array of quotients; a MaskedArray for "mask"
+
+    Raises:
+        ZeroDivisionError: Under "raise", naming the first zero divisor's index
+        ValueError: If the inputs have different lengths or the policy is unknown
+    """
+    if zero_divisor not in ZERO_DIVISOR_POLICIES:
+        raise ValueError(f"zero_divisor must be one of {ZERO_DIVISOR_POLICIES}, not {zero_divisor!r}")
+    left = as_array(num1)
+    right = as_array(num2)
+    if len(left) != len(right):
+        raise ValueError(f"arrays have different lengths: {len(left)} and {len(right)}")
+    dtype = np.promote_types(np.result_type(left, right), np.float64)
+
+    zero = right == 0
+    if zero_divisor == "raise" and zero.any():
+        raise ZeroDivisionError(f"Cannot divide by zero: divisor at index {offset + int(np.argmax(zero))}")
+    if dtype == object:
+        # Python ints past int64 raise rather than give inf: divide those
+        # rows by 1, then put in the IEEE result from the dividend's sign.
+        quotient = np.true_divide(left, np.where(zero, 1, right)).astype(np.float64)
+        if zero.any():
+            sign = (left[zero] > 0).astype(np.float64) - (left[zero] < 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                quotient[zero] = sign / right[zero].astype(np.float64)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotient = np.true_divide(left, right, dtype=dtype)
+    if zero_divisor == "mask":
+        return np.ma.MaskedArray(quotient, mask=zero)
+    return quotient
+
+
+def iter_csv_pairs(
+    path: Path,
+    columns: Tuple[int, int] = (0, 1),
+    header: bool = False,
+    chunk_rows: int = DEFAULT_CSV_ROWS,
+    dtype: Any = np.float64,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream two numeric columns of a CSV file as pairs of arrays.
+
+    Only ``chunk_rows`` lines are held at a time; each chunk is parsed by
+    ``np.loadtxt``, which skips empty lines and ``#`` comment lines.
+
+    Args:
+        path: CSV file
+        columns: Indexes of the dividend and divisor columns
+        header: Skip the first line
+        chunk_rows: Rows parsed per step
+        dtype: Element type of the arrays, e.g. np.int64
+
+    Yields:
+        (dividends, divisors) for each chunk of rows
+    """
+    for table, _, _ in _iter_csv_tables(path, columns, header, chunk_rows, dtype):
+        yield table[:, 0], table[:, 1]
+
+
+def _iter_csv_tables(
+    path: Path,
+    columns: Tuple[int, int],
+    header: bool,
+    chunk_rows: int,
+    dtype: Any,
+) -> Iterator[Tuple[np.ndarray, List[str], int]]:
+    """The parsed rows of each chunk, with its lines and first line number."""
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    with open(path, newline="", encoding="utf-8") as f:
+        line_number = 1
+        if header:
+            line_number += next(f, None) is not None
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                return
+            table = np.loadtxt(lines, delimiter=",", usecols=columns, dtype=dtype, ndmin=2)
+            yield table, lines, line_number
+            line_number += len(lines)
+
+
+def _data_lines(lines: List[str]) -> List[int]:
+    """Indexes of the lines np.loadtxt parses: those not empty once a # comment is cut off."""
+    return [index for index, line in enumerate(lines) if line.split("#", 1)[0].rstrip("\r\n")]
+
+
+def divide_csv(
+    path: Path,
+    zero_divisor: str = "nan",
+    columns: Tuple[int, int] = (0, 1),
+    header: bool = False,
+    chunk_rows: int = DEFAULT_CSV_ROWS,
+    dtype: Any = np.float64,
+) -> Iterator[np.ndarray]:
+    """
+    Divide the (a, b) pairs of a CSV file without reading it all at once.
+
+    Under "raise", the ZeroDivisionError names the row's line number in
+    the file (counting from 1, header, empty and comment lines included).
+
+    Args:
+        path: CSV file
+        zero_divisor: "raise", "nan" or "mask"
+        columns: Indexes of the dividend and divisor columns
+        header: Skip the first line
+        chunk_rows: Rows parsed per step
+        dtype: Element type the columns are parsed as
+
+    Yields:
+        The quotients of each chunk of rows
+    """
+    for table, lines, first_line in _iter_csv_tables(path, columns, header, chunk_rows, dtype):
+        dividends, divisors = table[:, 0], table[:, 1]
+        try:
+            quotients = divide_numbers_batch(dividends, divisors, zero_divisor)
+        except ZeroDivisionError:
+            # np.loadtxt skipped empty and comment lines, so map the row
+            # back to its line; only done once, on the way out.
+            row = int(np.argmax(divisors == 0))
+            line = first_line + _data_lines(lines)[row]
+            raise ZeroDivisionError(f"Cannot divide by zero: divisor on line {line} of {os.fspath(path)}") from None
+        yield quotients
+
+
+def _divide_with_try(pairs: List[Tuple[float, float]]) -> List[float]:
+    results = []
+    for a, b in pairs:
+        try:
+            results.append(divide_numbers(a, b))
+        except ZeroDivisionError:
+            results.append(float("nan"))
+    return results
+
+
+# Example usage: a million pairs as dicts versus columns, then a division grid
+def main():
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    num1 = rng.integers(-1000, 1000, count)
+    num2 = rng.integers(-20, 20, count)
+    pairs = list(zip(num1.tolist(), num2.tolist()))
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    dicts = [perform_arithmetic_operations(a, b) if b else None for a, b in pairs]
+    per_pair = time.perf_counter() - started
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    columns = perform_arithmetic_operations_batch(num1, num2)
+    batched = time.perf_counter() - started
+    column_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rows = columns.rows
+    for index in range(0, count, 997):
+        expected = dicts[index]
+        if expected is None:
+            assert rows[index]["division"] is None and rows[index]["modulus"] is None
+        else:
+            assert rows[index] == expected
+
+    print(f"{count:,} pairs ({int(columns.zero_divisor.sum()):,} with a zero divisor)")
+    print(f"  dict per pair:   {per_pair:6.2f}s  {dict_memory / 1e6:7.1f} MB")
+    print(f"  columns:         {batched:6.2f}s  {column_memory / 1e6:7.1f} MB")
+
+    # 1000 x 1000 grid of dividends and divisors, zeros included.
+    grid = np.arange(-500, 500)
+    dividends, divisors = (axis.ravel() for axis in np.meshgrid(grid, grid))
+    picked = rng.choice(len(dividends), 100_000, replace=False)
+    sample = list(zip(dividends[picked].tolist(), divisors[picked].tolist()))
+    started = time.perf_counter()
+    expected = _divide_with_try(sample)
+    looped = (time.perf_counter() - started) * len(dividends) / len(sample)
+    started = time.perf_counter()
+    masked = divide_numbers_batch(dividends, divisors, "mask")
+    kernel = time.perf_counter() - started
+    assert np.array_equal(masked[picked].filled(np.nan), expected, equal_nan=True)
+    print(f"{len(dividends):,}-pair division grid ({int(masked.mask.sum()):,} zero divisors)")
+    print(f"  try/except per pair: {looped:6.2f}s (extrapolated)")
+    print(f"  divide_numbers_batch: {kernel:6.3f}s")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "pairs.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("dividend,divisor\n")
+            np.savetxt(f, np.column_stack([dividends, divisors]), fmt="%d", delimiter=",")
+        started = time.perf_counter()
+        streamed = sum(len(chunk) for chunk in divide_csv(path, "nan", header=True, dtype=np.int64))
+        from_csv = time.perf_counter() - started
+    print(f"  divide_csv:           {from_csv:6.2f}s ({streamed:,} rows, {DEFAULT_CSV_ROWS:,} at a time)")
+
+
+if __name__ == "__main__":
+    main()
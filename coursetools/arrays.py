@@ -0,0 +1,169 @@
+"""
+Reference answers for the array problems in practice-problems-6.py.
+
+multiply_arrays (Problem 31) has a plain-list version matching the exercise
+signature and a batch version for grading over reference arrays with
+millions of elements. The list version multiplies Python ints, which never
+overflow; the batch version checks every chunk of fixed-width products and
+returns Python ints (an object array) when int64 cannot hold them.
+"""
+from typing import Any, List, Optional
+
+import numpy as np
+
+# Elements multiplied per step in multiply_arrays_batch. Keeps the working
+# set small when the inputs are memory-mapped files larger than RAM.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# float64 products of int64 values are within a relative 2**-51 of the
+# exact ones, so only products this close to a dtype's limits need an
+# exact check.
+_OVERFLOW_MARGIN = 1 - 2.0 ** -48
+
+
+def multiply_arrays(array1: List[int], array2: List[int]) -> List[int]:
+    """
+    Problem 31: Multiply corresponding elements of two integer arrays.
+
+    Example:
+        Input arrays: [1, 3, -5, 4] and [1, 4, -5, -2]
+        Output: [1, 12, 25, -8]
+
+    Args:
+        array1: First array of integers
+        array2: Second array of integers
+
+    Returns:
+        List containing products of corresponding elements
+    """
+    return [a * b for a, b in zip(array1, array2)]
+
+
+def as_array(values: Any, dtype: Optional[Any] = None) -> np.ndarray:
+    """
+    View ``values`` as a 1-D NumPy array, without copying where possible.
+
+    NumPy arrays (including ``np.memmap``) are returned as-is, and anything
+    supporting the buffer protocol (``array.array``, ``memoryview``,
+    ``mmap.mmap``) is wrapped in place. Only plain sequences such as lists
+    are copied.
+
+    Args:
+        values: List, array.array, NumPy array or buffer
+        dtype: Element type for untyped byte buffers such as ``mmap.mmap``
+
+    Returns:
+        One-dimensional array over the same data
+    """
+    if isinstance(values, np.ndarray):
+        array = values
+    else:
+        try:
+            view = memoryview(values)
+        except TypeError:
+            array = np.asarray(values, dtype=dtype)
+        else:
+            if dtype is not None and view.format in ("B", "b", "c"):
+                array = np.frombuffer(view, dtype=dtype)
+            else:
+                array = np.asarray(view)
+    if array.ndim != 1:
+        array = array.reshape(-1)
+    return array
+
+
+def batch_dtype(left: np.ndarray, right: np.ndarray) -> np.dtype:
+    """
+    The dtype elementwise integer kernels compute two arrays in.
+
+    Any mix of integer (or bool) arrays is widened to int64, or kept uint64
+    when both are unsigned: NumPy's own promotion turns uint64 with a signed
+    type into float64, whose products and sums are no longer exact. Other
+    inputs get np.result_type.
+    """
+    dtype = np.result_type(left, right)
+    if left.dtype.kind in "iub" and right.dtype.kind in "iub" and dtype != np.uint64:
+        return np.dtype(np.int64)
+    return dtype
+
+
+def multiply_arrays_batch(
+    array1: Any,
+    array2: Any,
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[Any] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Multiply corresponding elements of two large arrays.
+
+    Buffer-protocol inputs are read in place, and the product is computed
+    ``chunk_size`` elements at a time so memory-mapped inputs never have to
+    be paged in all at once. Pass ``out`` (for example another ``np.memmap``)
+    to write the result in place; it may also be one of the inputs.
+
+    Integer products are never allowed to wrap around. Without ``out`` they
+    are int64 for any mix of integer dtypes (uint64 when both inputs are
+    unsigned and one is uint64), and if any product does not fit, the whole
+    result is an object array of Python ints, as multiply_arrays would give.
+    An integer ``out`` raises OverflowError instead, leaving the chunks
+    before the offending one written.
+
+    Example:
+        Input arrays: array('i', [1, 3, -5, 4]) and np.array([1, 4, -5, -2])
+        Output: array([1, 12, 25, -8])
+
+    Args:
+        array1: First array (list, array.array, NumPy array or buffer)
+        array2: Second array, same length as the first
+        out: Optional array to write the products into
+        dtype: Element type for untyped byte buffers
+        chunk_size: Number of elements multiplied per step
+
+    Returns:
+        Array of products (``out`` itself when given)
+
+    Raises:
+        ValueError: If the arrays (or ``out``) have different lengths
+        OverflowError: If a product does not fit in an integer ``out``
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    left = as_array(array1, dtype)
+    right = as_array(array2, dtype)
+    if len(left) != len(right):
+        raise ValueError(f"arrays have different lengths: {len(left)} and {len(right)}")
+    given = out is not None
+    if not given:
+        out = np.empty(len(left), dtype=batch_dtype(left, right))
+    elif len(out) != len(left):
+        raise ValueError(f"out has length {len(out)}, expected {len(left)}")
+    checked = out.dtype.kind in "iu"
+    with np.errstate(over="ignore", invalid="ignore"):
+        for start in range(0, len(left), chunk_size):
+            stop = start + chunk_size
+            a, b = left[start:stop], right[start:stop]
+            # Checked before multiplying, since out may be one of the inputs.
+            wrapped = _first_overflow(a, b, out.dtype) if checked else None
+            if wrapped is not None:
+                if given:
+                    raise OverflowError(f"product at index {start + wrapped} does not fit in {out.dtype}")
+                return np.multiply(left.astype(object), right.astype(object))
+            # In out's dtype: int32 inputs would otherwise wrap before widening.
+            # A uint64 value cast to int64 wraps too, but products are computed
+            # modulo 2**64, so every product that fits still comes out exact.
+            np.multiply(a, b, out=out[start:stop], dtype=out.dtype)
+    return out
+
+
+def _first_overflow(a: np.ndarray, b: np.ndarray, dtype: np.dtype) -> Optional[int]:
+    """Index of the first a[i] * b[i] that does not fit in an integer dtype, if any."""
+    info = np.iinfo(dtype)
+    estimate = a.astype(np.float64) * b.astype(np.float64)
+    # Strict below: for unsigned dtypes the lower limit is 0, and zero
+    # products must not all become suspects.
+    suspects = np.flatnonzero((estimate >= info.max * _OVERFLOW_MARGIN) | (estimate < info.min * _OVERFLOW_MARGIN))
+    for index in suspects.tolist():
+        if not info.min <= int(a[index]) * int(b[index]) <= info.max:
+            return index
+    return None
@@ -0,0 +1,366 @@
+"""
+Reference answer for calculate_average in practice-problems-2.py, plus a
+streaming accumulator for class-wide statistics over any number of marks.
+
+RunningStats keeps the count, minimum, maximum and the sum of squared
+deviations from the mean (``M2``) instead of the marks themselves. Single
+values update M2 with Welford's recurrence. NumPy chunks are summarized on
+their own (mean, then the squared deviations from it) and folded in with
+Chan et al.'s pairwise formula, and that is also how merge() combines
+accumulators filled in different processes. Both avoid the cancellation of
+``sum(x*x)/n - mean**2``, which loses every digit once the marks sit on a
+large offset.
+
+The sum is kept exactly, as a short list of non-overlapping floats (the
+"partials" ``math.fsum`` works with internally), so the mean is
+``math.fsum(all values) / count`` however the values were split into
+chunks or across workers.
+
+csv_stats streams one column of a CSV file a chunk of rows at a time, so
+memory stays constant whatever the file size; with several workers, each
+process takes a byte range of the file and the partial results are merged.
+
+Usage:
+    python -m coursetools.averages                          # benchmark
+    python -m coursetools.averages FILE [-c COLUMN] [--header] [-j N]
+"""
+import argparse
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from numbers import Real
+from statistics import StatisticsError
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Values converted per step when update() is given a plain iterable.
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+# Rows parsed per step in csv_stats.
+DEFAULT_CSV_ROWS = 1 << 18
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def calculate_average(num1: float, num2: float, num3: float, num4: float) -> float:
+    """
+    Calculate the average of four numbers.
+
+    Args:
+        num1 (float): First number
+        num2 (float): Second number
+        num3 (float): Third number
+        num4 (float): Fourth number
+
+    Returns:
+        float: Average of the four numbers
+
+    Example:
+        Input: 10, 15, 20, 30
+        Output: 18.75
+    """
+    return (num1 + num2 + num3 + num4) / 4
+
+
+def _exact_partials(values: Iterable[float]) -> List[float]:
+    """
+    Non-overlapping floats, largest first, that sum exactly to the values.
+
+    Each pass rounds what is left of the exact sum with ``math.fsum``; the
+    remainder shrinks by at least 53 bits a pass, so it takes two or three.
+    """
+    values = list(values)
+    partials: List[float] = []
+    while True:
+        try:
+            rest = math.fsum(chain(values, [-partial for partial in partials]))
+        except OverflowError:  # the exact sum, or a step towards it
+            raise ValueError("sum of the values is beyond the float range") from None
+        if rest == 0.0:
+            return partials
+        if not math.isfinite(rest):
+            raise ValueError("cannot sum non-finite values")
+        partials.append(rest)
+
+
+class RunningStats:
+    """
+    Count, exact mean, variance, minimum and maximum of a stream of numbers.
+
+    Feed it with add() or update(); combine accumulators with merge(). The
+    state is a handful of floats, so accumulators pickle cheaply between
+    processes.
+
+    Non-finite values raise ValueError, and so does a running sum beyond
+    the float range (about 1.8e308, e.g. adding 1e308 twice), since the
+    exact sum could no longer be kept. The accumulator is left as it was
+    before the call that raised.
+    """
+
+    __slots__ = ("count", "minimum", "maximum", "_partials", "_m2")
+
+    def __init__(self, values: Any = None):
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._partials: List[float] = []
+        self._m2 = 0.0
+        if values is not None:
+            self.update(values)
+
+    @property
+    def total(self) -> float:
+        """The sum of the values, correctly rounded."""
+        return self._partials[0] if self._partials else 0.0
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            raise StatisticsError("mean requires at least one data point")
+        return self.total / self.count
+
+    @property
+    def pvariance(self) -> float:
+        """Population variance (divides by n)."""
+        if not self.count:
+            raise StatisticsError("pvariance requires at least one data point")
+        return self._m2 / self.count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (divides by n - 1)."""
+        if self.count < 2:
+            raise StatisticsError("variance requires at least two data points")
+        return self._m2 / (self.count - 1)
+
+    @property
+    def pstdev(self) -> float:
+        return math.sqrt(self.pvariance)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def add(self, value: float) -> "RunningStats":
+        """Add one value (Welford's update)."""
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"cannot add non-finite value {value!r}")
+        old_mean = self.total / self.count if self.count else 0.0
+        self._partials = _exact_partials([value, *self._partials])
+        self.count += 1
+        self._m2 += (value - old_mean) * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        return self
+
+    def update(self, values: Any) -> "RunningStats":
+        """
+        Add a scalar, a NumPy array or any iterable of numbers.
+
+        Arrays are taken whole, as one chunk; other iterables are read
+        DEFAULT_CHUNK_SIZE values at a time, so generators stream.
+
+        Returns:
+            self, for chaining
+        """
+        if isinstance(values, Real):
+            return self.add(values)
+        if isinstance(values, np.ndarray):
+            return self._update_chunk(values)
+        iterator = iter(values)
+        while True:
+            chunk = np.fromiter(islice(iterator, DEFAULT_CHUNK_SIZE), dtype=np.float64)
+            if not len(chunk):
+                return self
+            self._update_chunk(chunk)
+
+    def _update_chunk(self, values: np.ndarray) -> "RunningStats":
+        chunk = np.asarray(values, dtype=np.float64).ravel()
+        if not len(chunk):
+            return self
+        low, high = chunk.min(), chunk.max()
+        if not (math.isfinite(low) and math.isfinite(high)):
+            raise ValueError("cannot add non-finite values")
+        other = RunningStats()
+        other.count = len(chunk)
+        other.minimum, other.maximum = float(low), float(high)
+        other._partials = _exact_partials(chunk.tolist())
+        deviations = chunk - other.mean
+        other._m2 = float(np.dot(deviations, deviations))
+        return self.merge(other)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Fold another accumulator into this one (Chan et al.'s formula).
+
+        Returns:
+            self, for chaining
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.minimum, self.maximum = other.count, other.minimum, other.maximum
+            self._partials, self._m2 = list(other._partials), other._m2
+            return self
+        partials = _exact_partials(self._partials + other._partials)
+        delta = other.mean - self.mean
+        count = self.count + other.count
+        self._m2 += other._m2 + delta * delta * (self.count / count) * other.count
+        self.count = count
+        self._partials = partials
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "RunningStats(count=0)"
+        return (f"RunningStats(count={self.count}, mean={self.mean!r}, pstdev={self.pstdev!r}, "
+                f"minimum={self.minimum!r}, maximum={self.maximum!r})")
+
+
+def _byte_ranges(size: int, parts: int) -> List[Tuple[int, int]]:
+    edges = [size * part // parts for part in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if start < stop]
+
+
+def _parse(lines: List[bytes], column: int) -> np.ndarray:
+    return np.loadtxt(lines, delimiter=",", usecols=(column,), dtype=np.float64, ndmin=1)
+
+
+def _range_stats(task: Tuple[Path, int, int, int, bool, int]) -> RunningStats:
+    """Statistics of the lines that start in [start, stop) of a CSV file."""
+    path, start, stop, column, header, chunk_rows = task
+    stats = RunningStats()
+    with open(path, "rb") as f:
+        position = start
+        if start:
+            # The line running across start belongs to the range before.
+            f.seek(start - 1)
+            position += len(f.readline()) - 1
+        elif header:
+            position += len(f.readline())
+        lines = []
+        for line in f:
+            if position >= stop:
+                break
+            position += len(line)
+            lines.append(line)
+            if len(lines) == chunk_rows:
+                stats.update(_parse(lines, column))
+                lines = []
+        if lines:
+            stats.update(_parse(lines, column))
+    return stats
+
+
+def csv_stats(
+    path: Path,
+    column: int = 0,
+    header: bool = False,
+    workers: Optional[int] = 1,
+    chunk_rows: int = DEFAULT_CSV_ROWS,
+) -> RunningStats:
+    """
+    Statistics of one numeric column of a CSV file, at constant memory.
+
+    Args:
+        path: CSV file
+        column: Index of the column
+        header: Skip the first line
+        workers: Worker processes, each reading a byte range of the file
+            (None: one per CPU; 1: read in the calling process)
+        chunk_rows: Rows parsed per step
+
+    Returns:
+        RunningStats of the column
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    tasks = [(path, start, stop, column, header, chunk_rows) for start, stop in _byte_ranges(size, workers)]
+    if len(tasks) <= 1:
+        return _range_stats((path, 0, size, column, header, chunk_rows))
+    stats = RunningStats()
+    with ProcessPoolExecutor(workers) as pool:
+        for part in pool.map(_range_stats, tasks):
+            stats.merge(part)
+    return stats
+
+
+def _naive_stats(values: np.ndarray) -> Tuple[float, float]:
+    # One pass of sum and sum of squares, as a textbook loop would do it.
+    total = squares = 0.0
+    for value in values.tolist():
+        total += value
+        squares += value * value
+    mean = total / len(values)
+    return mean, squares / len(values) - mean * mean
+
+
+# Example usage: marks on a large offset, then a generated CSV of marks (or FILE)
+def main():
+    parser = argparse.ArgumentParser(description="Count, mean, spread and range of a CSV column.")
+    parser.add_argument("path", nargs="?", help="CSV file; omit to run the benchmark")
+    parser.add_argument("-c", "--column", type=int, default=0, help="column index (default: 0)")
+    parser.add_argument("--header", action="store_true", help="skip the first line")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes (default: one per CPU)")
+    options = parser.parse_args()
+
+    if options.path:
+        print(csv_stats(options.path, options.column, options.header, options.workers))
+        return
+
+    assert calculate_average(10, 15, 20, 30) == 18.75
+
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    marks = np.round(np.clip(rng.normal(65, 15, count), 0, 100) * 2) / 2
+    shifted = marks + 1e9
+    started = time.perf_counter()
+    naive_variance = _naive_stats(shifted)[1]
+    naive = time.perf_counter() - started
+    started = time.perf_counter()
+    stats = RunningStats(shifted)
+    streamed = time.perf_counter() - started
+    assert stats.mean == math.fsum(shifted.tolist()) / count
+    expected = np.var(marks)
+    print(f"{count:,} marks + 1e9, population variance {expected:.6f}")
+    print(f"  sum and sum of squares: {naive:6.2f}s  variance {naive_variance:14.6f}")
+    print(f"  RunningStats:           {streamed:6.2f}s  variance {stats.pvariance:14.6f}")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "marks.csv")
+        rows = 4_000_000
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("student,mark\n")
+            for start in range(0, rows, count):
+                block = np.round(np.clip(rng.normal(65, 15, count), 0, 100) * 2) / 2
+                np.savetxt(f, np.column_stack([np.arange(start, start + count), block]),
+                           fmt=("%d", "%.1f"), delimiter=",")
+        size = os.path.getsize(path) / 1e6
+
+        started = time.perf_counter()
+        serial = csv_stats(path, column=1, header=True)
+        elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        parallel = csv_stats(path, column=1, header=True, workers=4)
+        pooled = time.perf_counter() - started
+
+    assert serial.count == parallel.count == rows
+    assert serial.mean == parallel.mean
+    assert math.isclose(serial.pvariance, parallel.pvariance, rel_tol=1e-12)
+    print(f"{rows:,}-row CSV ({size:.0f} MB): {serial}")
+    print(f"  csv_stats:            {elapsed:6.2f}s ({DEFAULT_CSV_ROWS:,} rows at a time)")
+    print(f"  csv_stats (4 ranges): {pooled:6.2f}s, merged mean identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Reference answers for NumberAndStringChecks in practice-problems-7.py, with
+vectorized versions for testing submissions on millions of inputs.
+
+- The numeric checks broadcast over NumPy arrays like the *_batch
+  functions in coursetools.predicates. is_multiple_of_3_or_7 needs a
+  single ``% 21`` and a 21-entry lookup table instead of two divisions.
+- starts_with_word_batch compares a list or array of texts against one
+  word (or one word per text) on NumPy string arrays.
+- starts_with_any_word checks texts against a set of words. With a few
+  words it repeats the NumPy comparison; with many it walks a PrefixTrie,
+  which reads each text only as far as the longest word it could match.
+
+The differential tests reuse coursetools.predicates, with references keyed
+"NumberAndStringChecks.<method>".
+
+Usage:
+    python -m coursetools.checks                    # benchmark
+    python -m coursetools.checks submission.py      # differential test
+"""
+import argparse
+import json
+import time
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+from coursetools.predicates import (
+    DEFAULT_INPUTS,
+    DEFAULT_SAMPLE_SIZE,
+    Reference,
+    as_int_arrays,
+    check_submission,
+    near,
+)
+
+# Inputs per predicate in the benchmark.
+BENCHMARK_INPUTS = 10_000_000
+
+# Inputs per predicate for which the scalar answer is checked too.
+DEFAULT_SCALAR_INPUTS = 100_000
+
+# From this many words on, starts_with_any_word walks a trie.
+DEFAULT_TRIE_THRESHOLD = 8
+
+# number % 21 -> whether number is a multiple of 3 or 7.
+_MULTIPLE_OF_3_OR_7 = np.array([residue % 3 == 0 or residue % 7 == 0 for residue in range(21)])
+
+# Marks the end of a word in a PrefixTrie node.
+_WORD = ""
+
+
+class NumberAndStringChecks:
+    @staticmethod
+    def is_multiple_of_3_or_7(number: int) -> bool:
+        """
+        Problem 33: Check if a given positive number is a multiple of 3 or 7.
+
+        Examples:
+            >>> is_multiple_of_3_or_7(15)
+            True  # because 15 is a multiple of 3
+            >>> is_multiple_of_3_or_7(14)
+            True  # because 14 is a multiple of 7
+            >>> is_multiple_of_3_or_7(8)
+            False
+
+        Args:
+            number: Positive integer to check
+
+        Returns:
+            True if the number is a multiple of 3 or 7, false otherwise
+        """
+        return number % 3 == 0 or number % 7 == 0
+
+    @staticmethod
+    def starts_with_word(text: str, word: str) -> bool:
+        """
+        Problem 34: Check if a string starts with a specified word.
+
+        Examples:
+            >>> starts_with_word("Hello how are you?", "Hello")
+            True
+            >>> starts_with_word("Good morning!", "Hello")
+            False
+
+        Note: The check should be case-sensitive
+
+        Args:
+            text: String to check
+            word: Word to look for at the start
+
+        Returns:
+            True if the string starts with the specified word, false otherwise
+        """
+        return text.startswith(word)
+
+    @staticmethod
+    def check_number_range(num1: int, num2: int) -> bool:
+        """
+        Problem 35: Check if one number is less than 100 and another is greater than 200.
+
+        Examples:
+            >>> check_number_range(75, 250)
+            True
+            >>> check_number_range(150, 250)
+            False
+
+        Note: Either number can be the one less than 100 while the other is greater than 200
+
+        Args:
+            num1: First number to check
+            num2: Second number to check
+
+        Returns:
+            True if one number is < 100 and the other is > 200, false otherwise
+        """
+        return (num1 < 100 and num2 > 200) or (num2 < 100 and num1 > 200)
+
+    @staticmethod
+    def is_in_range(num1: int, num2: int) -> bool:
+        """
+        Problem 36: Check if either of two integers is in the range -10 to 10 (inclusive).
+
+        Examples:
+            >>> is_in_range(-5, 8)
+            True  # both numbers are in range
+            >>> is_in_range(-15, 15)
+            False  # neither number is in range
+
+        Note: The range includes both -10 and 10
+
+        Args:
+            num1: First number to check
+            num2: Second number to check
+
+        Returns:
+            True if either number is in the range -10 to 10, false otherwise
+        """
+        return -10 <= num1 <= 10 or -10 <= num2 <= 10
+
+
+def is_multiple_of_3_or_7_batch(number: Any) -> np.ndarray:
+    """Array version of NumberAndStringChecks.is_multiple_of_3_or_7."""
+    (number,) = as_int_arrays(number)
+    # NumPy's % takes the sign of the divisor, as Python's does: 0 to 20.
+    return _MULTIPLE_OF_3_OR_7[np.asarray(number % 21, dtype=np.intp)]
+
+
+def check_number_range_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of NumberAndStringChecks.check_number_range."""
+    num1, num2 = as_int_arrays(num1, num2)
+    return np.asarray(((num1 < 100) & (num2 > 200)) | ((num2 < 100) & (num1 > 200)), dtype=bool)
+
+
+def is_in_range_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of NumberAndStringChecks.is_in_range."""
+    num1, num2 = as_int_arrays(num1, num2)
+    return np.asarray(((num1 >= -10) & (num1 <= 10)) | ((num2 >= -10) & (num2 <= 10)), dtype=bool)
+
+
+def starts_with_word_batch(texts: Any, word: Any) -> np.ndarray:
+    """
+    Array version of NumberAndStringChecks.starts_with_word.
+
+    Args:
+        texts: Strings to check, as a list or a NumPy string array
+        word: One word for all texts, or one word per text
+
+    Returns:
+        Boolean array, True where the text starts with its word
+    """
+    return np.char.startswith(np.asarray(texts, dtype=str), np.asarray(word, dtype=str))
+
+
+class PrefixTrie:
+    """
+    A character trie over a set of words.
+
+    Each node is a dict from the next character to the child node; a node
+    where a word ends also maps "" to that word.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root: Dict[str, Any] = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_WORD] = word
+
+    def longest_prefix(self, text: str) -> str:
+        """
+        Return the longest word that text starts with.
+
+        Raises:
+            KeyError: If text starts with none of the words
+        """
+        node = self.root
+        found = node.get(_WORD)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(_WORD, found)
+        if found is None:
+            raise KeyError(text)
+        return found
+
+    def starts_any(self, text: str) -> bool:
+        """Return True if text starts with at least one of the words."""
+        node = self.root
+        if _WORD in node:
+            return True
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _WORD in node:
+                return True
+        return False
+
+
+def starts_with_any_word(
+    texts: Any,
+    words: Iterable[str],
+    trie_threshold: int = DEFAULT_TRIE_THRESHOLD,
+) -> np.ndarray:
+    """
+    Check each text against a set of words.
+
+    Fewer than ``trie_threshold`` words are compared one at a time on a
+    NumPy string array; more are looked up in a PrefixTrie, so the cost per
+    text no longer grows with the number of words.
+
+    Args:
+        texts: Strings to check, as a list or a NumPy string array
+        words: Words to look for at the start
+        trie_threshold: Number of words from which the trie is used
+
+    Returns:
+        Boolean array, True where the text starts with any of the words
+    """
+    words = list(dict.fromkeys(words))
+    if len(words) < trie_threshold:
+        texts = np.asarray(texts, dtype=str)
+        result = np.zeros(texts.shape, dtype=bool)
+        for word in words:
+            result |= np.char.startswith(texts, word)
+        return result
+    trie = PrefixTrie(words)
+    if isinstance(texts, np.ndarray):
+        texts = texts.tolist()
+    return np.fromiter(map(trie.starts_any, texts), dtype=bool, count=len(texts))
+
+
+# Vocabulary for generated texts: words sharing prefixes and differing in case.
+_VOCABULARY = np.array(["Hello", "hello", "Hell", "He", "Help", "HELLO", "Good", "good", "", "Hello!"])
+_TAILS = np.array(["", " ", " how are you?", " morning!", "o", "!", "there"])
+
+
+def _texts(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    texts = np.char.add(_VOCABULARY[rng.integers(0, len(_VOCABULARY), count)],
+                        _TAILS[rng.integers(0, len(_TAILS), count)])
+    return texts, _VOCABULARY[rng.integers(0, len(_VOCABULARY), count)]
+
+
+def _positive(rng: np.random.Generator, count: int) -> Tuple[np.ndarray]:
+    return (rng.integers(1, 1_000_000, count),)
+
+
+def _around_range(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    return rng.integers(-50, 351, count), rng.integers(-50, 351, count)
+
+
+def _around_ten(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    return rng.integers(-30, 31, count), rng.integers(-30, 31, count)
+
+
+REFERENCES: Dict[str, Reference] = {
+    "NumberAndStringChecks.is_multiple_of_3_or_7": Reference(
+        is_multiple_of_3_or_7_batch,
+        lambda n: (n % 7 == 0) | (n % 21 == 0),  # the rarer divisor, and both
+        _positive,
+    ),
+    "NumberAndStringChecks.starts_with_word": Reference(
+        starts_with_word_batch,
+        # Same start ignoring case: where a case-insensitive answer goes wrong.
+        lambda texts, words: np.char.startswith(np.char.lower(texts), np.char.lower(words)),
+        _texts,
+    ),
+    "NumberAndStringChecks.check_number_range": Reference(
+        check_number_range_batch,
+        lambda a, b: near(a, 100, 200) | near(b, 100, 200),
+        _around_range,
+    ),
+    "NumberAndStringChecks.is_in_range": Reference(
+        is_in_range_batch,
+        lambda a, b: near(a, -10, 10) | near(b, -10, 10),
+        _around_ten,
+    ),
+}
+
+
+def _benchmark(count: int, scalar_count: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{count:,} inputs per predicate")
+    for name, reference in REFERENCES.items():
+        inputs = reference.generate(rng, count)
+        started = time.perf_counter()
+        expected = reference.batch(*inputs)
+        batched = time.perf_counter() - started
+
+        scalar = getattr(NumberAndStringChecks, name.split(".")[1])
+        columns = [array[:scalar_count].tolist() for array in inputs]
+        started = time.perf_counter()
+        looped = [scalar(*args) for args in zip(*columns)]
+        per_call = (time.perf_counter() - started) / len(looped) * count
+        assert looped == expected[:scalar_count].tolist()
+        print(f"  {name.split('.')[1]:<24} batch {batched:6.3f}s   per call {per_call:6.2f}s (extrapolated)")
+
+    # The trie walks texts in Python, so it gets a tenth of the inputs.
+    texts = REFERENCES["NumberAndStringChecks.starts_with_word"].generate(rng, count // 10)[0]
+    few = ["Hello", "Good"]
+    many = few + [f"{word}{number}" for word in ("Hello", "He", "Good") for number in range(100)]
+    for words in (few, many):
+        started = time.perf_counter()
+        matched = starts_with_any_word(texts, words)
+        elapsed = time.perf_counter() - started
+        print(f"  starts_with_any_word, {len(words):>3} words, {len(texts):,} texts: "
+              f"{elapsed:6.3f}s ({int(matched.sum()):,} matches)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential tests for practice-problems-7.py.")
+    parser.add_argument("submission", nargs="?", help="student file to test; omit to run the benchmark")
+    parser.add_argument("-n", "--inputs", type=int,
+                        help=f"random inputs per predicate (default: {DEFAULT_INPUTS:,} for a submission, "
+                             f"{BENCHMARK_INPUTS:,} for the benchmark)")
+    parser.add_argument("--sample", type=int, default=DEFAULT_SAMPLE_SIZE,
+                        help="random and edge-case inputs to call the student on (default: %(default)s)")
+    options = parser.parse_args()
+
+    if options.submission:
+        count = options.inputs or DEFAULT_INPUTS
+        results = check_submission(options.submission, REFERENCES, count, options.sample)
+        print(json.dumps(results, indent=2))
+        return
+    count = options.inputs or BENCHMARK_INPUTS
+    _benchmark(count, min(count, DEFAULT_SCALAR_INPUTS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Reference answers for convert_to_lowercase and find_longest_word in
+practice-problems-5.py, plus a streaming pipeline that runs both over the
+teaching corpus: the assignment markdown (materials/Assignment_*.md) and
+the markdown cells of the notebooks.
+
+Files are read in chunks of DEFAULT_CHUNK_SIZE characters. Each chunk is
+cut back to its last whitespace and the partial word at the end is carried
+into the next chunk, so every piece ends between words: ``str.lower`` runs
+once per piece (and final-sigma lowercasing comes out as for the whole
+text), and the longest word of a piece is ``max(piece.split(), key=len)``.
+A word only replaces the current longest when it is strictly longer, so
+the first of equally long words wins, across chunks as in the exercise.
+
+scan_corpus processes the files of a directory on a process pool and
+merges the per-file winners in file order.
+
+Usage:
+    python -m coursetools.corpus                     # materials/, benchmark
+    python -m coursetools.corpus DIR [-o OUT] [-j N]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+# Characters read per step.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Files that make up the corpus, relative to the directory scanned.
+DEFAULT_PATTERNS = ("Assignment_*.md", "*.ipynb")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def convert_to_lowercase(input_str: str) -> str:
+    """
+    Problem 23: Write a program to convert a given string into lowercase.
+
+    Example:
+        Input: "Write A Python PROGRAM"
+        Output: "write a python program"
+
+    Args:
+        input_str: String to convert to lowercase
+
+    Returns:
+        Lowercase version of the input string
+    """
+    return input_str.lower()
+
+
+def find_longest_word(sentence: str) -> str:
+    """
+    Problem 24: Find the longest word in a string.
+
+    Example:
+        Input: "Write a Python Program to display the following pattern"
+        Output: "following"
+
+    Note: If there are multiple words with the same length, return the first one.
+
+    Args:
+        sentence: Input string to analyze
+
+    Returns:
+        The longest word in the string
+    """
+    # max() keeps the first of equal maxima.
+    return max(sentence.split(), key=len, default="")
+
+
+class FileResult(NamedTuple):
+    """What one file contributes to a corpus scan."""
+
+    path: str
+    characters: int  # characters of text read (markdown cells only, for notebooks)
+    longest_word: str
+
+
+class CorpusResult(NamedTuple):
+    """Outcome of scan_corpus."""
+
+    files: List[FileResult]  # in file order
+    longest_word: str  # the first of the longest words, in file order
+    path: Optional[str]  # file the longest word came from
+
+
+def iter_text(path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream the text of a corpus file.
+
+    Notebooks yield the source of each markdown cell, separated by a
+    newline; any other file is read as UTF-8 text in chunks.
+
+    Args:
+        path: File to read
+        chunk_size: Characters read per step
+
+    Yields:
+        Pieces of text, in order
+    """
+    if os.fspath(path).endswith(".ipynb"):
+        with open(path, encoding="utf-8") as f:
+            notebook = json.load(f)
+        for cell in notebook.get("cells", []):
+            if cell.get("cell_type") == "markdown":
+                source = cell.get("source", "")
+                yield "".join(source) if isinstance(source, list) else source
+                yield "\n"
+        return
+    with open(path, encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def whole_words(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Re-cut a stream of text so that no word is split between pieces.
+
+    Each piece except the last ends in whitespace; the partial word at the
+    end of a chunk is carried to the front of the next one.
+    """
+    carry = ""
+    for chunk in chunks:
+        end = len(chunk)
+        # Only the trailing partial word is scanned, not the whole chunk.
+        while end and not chunk[end - 1].isspace():
+            end -= 1
+        if end == 0:
+            carry += chunk
+            continue
+        yield carry + chunk[:end]
+        carry = chunk[end:]
+    if carry:
+        yield carry
+
+
+def process_text(chunks: Iterable[str], out: Optional[TextIO] = None) -> Tuple[int, str]:
+    """
+    Lowercase a stream of text and find its longest word.
+
+    Args:
+        chunks: Text in pieces, e.g. from iter_text()
+        out: Stream the lowercased text is written to, if any
+
+    Returns:
+        (characters read, first longest word)
+    """
+    characters = 0
+    longest = ""
+    for piece in whole_words(chunks):
+        characters += len(piece)
+        if out is not None:
+            out.write(piece.lower())
+        candidate = max(piece.split(), key=len, default="")
+        if len(candidate) > len(longest):
+            longest = candidate
+    return characters, longest
+
+
+def process_file(path: PathLike, out_path: Optional[PathLike] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> FileResult:
+    """
+    Find the longest word of one corpus file, optionally writing it lowercased.
+
+    Args:
+        path: Markdown, text or notebook file
+        out_path: File to write the lowercased text to, if any
+        chunk_size: Characters read per step
+
+    Returns:
+        FileResult for the file
+    """
+    chunks = iter_text(path, chunk_size)
+    if out_path is None:
+        characters, longest = process_text(chunks)
+    else:
+        with open(out_path, "w", encoding="utf-8") as out:
+            characters, longest = process_text(chunks, out)
+    return FileResult(os.fspath(path), characters, longest)
+
+
+def corpus_files(root: PathLike, patterns: Iterable[str] = DEFAULT_PATTERNS) -> List[Path]:
+    """Files under root matching any of the patterns, in path order."""
+    found = set()
+    for pattern in patterns:
+        found.update(path for path in Path(root).rglob(pattern) if path.is_file())
+    return sorted(found)
+
+
+def _process(task: Tuple[Path, Optional[Path], int]) -> FileResult:
+    path, out_path, chunk_size = task
+    return process_file(path, out_path, chunk_size)
+
+
+def scan_corpus(
+    root: PathLike,
+    out_dir: Optional[PathLike] = None,
+    workers: Optional[int] = None,
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> CorpusResult:
+    """
+    Lowercase the corpus files under a directory and find the longest word.
+
+    Files are processed on a process pool; ``workers=1`` (or a single
+    file) runs in the calling process. Results come back in file order, so
+    ties between files go to the file that sorts first.
+
+    Args:
+        root: Directory to scan
+        out_dir: Directory for lowercased copies (``<relative path>.txt``), if any
+        workers: Worker processes (default: one per CPU)
+        patterns: Glob patterns of the files to include
+        chunk_size: Characters read per step
+
+    Returns:
+        CorpusResult with one FileResult per file
+    """
+    paths = corpus_files(root, patterns)
+    tasks = []
+    for path in paths:
+        out_path = None
+        if out_dir is not None:
+            out_path = Path(out_dir, path.relative_to(root)).with_name(path.name + ".txt")
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+        tasks.append((path, out_path, chunk_size))
+
+    if workers == 1 or len(tasks) <= 1:
+        files = [_process(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            files = list(pool.map(_process, tasks))
+
+    best: Optional[FileResult] = None
+    for result in files:
+        if best is None or len(result.longest_word) > len(best.longest_word):
+            best = result
+    if best is None or not best.longest_word:
+        return CorpusResult(files, "", None)
+    return CorpusResult(files, best.longest_word, best.path)
+
+
+# Example usage: the course materials, then a generated ~50 MB file
+def main():
+    parser = argparse.ArgumentParser(description="Lowercase a corpus and find its longest word.")
+    parser.add_argument("root", nargs="?", help="directory to scan (default: materials/, plus a benchmark)")
+    parser.add_argument("-o", "--out", help="directory for lowercased copies")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes (default: one per CPU)")
+    options = parser.parse_args()
+
+    root = options.root or Path(__file__).resolve().parent.parent / "materials"
+    started = time.perf_counter()
+    result = scan_corpus(root, options.out, options.workers)
+    elapsed = time.perf_counter() - started
+    for entry in result.files:
+        print(f"  {entry.characters:>9,}  {len(entry.longest_word):>4}  {os.path.relpath(entry.path, root)}")
+    print(f"{len(result.files)} files in {elapsed:.2f}s; longest word ({len(result.longest_word)} characters) "
+          f"from {result.path and os.path.relpath(result.path, root)}:")
+    print(f"  {result.longest_word[:120]}")
+    if options.root:
+        return
+
+    vocabulary = "Write a Python Program to display the following PATTERN ΣΟΦΟΣ".split()
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "corpus.md")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(50):
+                f.write(" ".join(random.choices(vocabulary, k=150_000)))
+                f.write("\n")
+        size = os.path.getsize(path) / 1e6
+
+        started = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        expected = (convert_to_lowercase(text), find_longest_word(text))
+        whole = time.perf_counter() - started
+        del text
+
+        started = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            per_character = "".join(char.lower() for char in f.read())
+        one_by_one = time.perf_counter() - started
+
+        out_path = os.path.join(scratch, "lower.md")
+        started = time.perf_counter()
+        streamed = process_file(path, out_path)
+        streaming = time.perf_counter() - started
+        with open(out_path, encoding="utf-8") as f:
+            assert (f.read(), streamed.longest_word) == expected
+        del per_character, expected
+
+    print(f"{size:.0f} MB generated text")
+    print(f"  whole string (lower + split): {size / whole:6.1f} MB/s")
+    print(f"  per-character lower:          {size / one_by_one:6.1f} MB/s")
+    print(f"  process_file (streaming):     {size / streaming:6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
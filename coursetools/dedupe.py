@@ -0,0 +1,229 @@
+"""
+Content-addressed index of the course material trees.
+
+Every practice file, PDF, CSV and docx exists several times over: as
+``materials/x``, ``materials/x (1)`` and again under the Coda export. This
+tool finds those copies by content so the publishing pipeline only has to
+upload each one once.
+
+Files are compared in three stages: by size, then by a BLAKE2 hash of the
+first block, and only files that still collide are hashed in full. Digests
+are kept in a JSON index keyed by path and reused while a file's size and
+mtime are unchanged.
+
+Usage:
+    python -m coursetools.dedupe materials "Coda Export Joshua Aaron's Webpage"
+    python -m coursetools.dedupe materials --manifest manifest.json
+    python -m coursetools.dedupe materials --hardlink
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_INDEX = ".content-index.json"
+PREFIX_SIZE = 64 * 1024
+READ_SIZE = 1024 * 1024
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache"}
+
+# Browser-style copy suffix: "name (1).py"
+_COPY_SUFFIX_RE = re.compile(r" \(\d+\)(\.[^.]*)?$")
+
+
+def _hash_file(path: str, limit: Optional[int] = None) -> str:
+    digest = hashlib.blake2b(digest_size=32)
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = READ_SIZE if remaining is None else min(READ_SIZE, remaining)
+            block = f.read(size)
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+
+def iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every regular file below a directory."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+class ContentIndex:
+    """
+    Persistent map from path to file digest.
+
+    Entries record size and mtime so a digest is only recomputed when the
+    file changes. ``prefix`` holds the first-block hash, ``digest`` the full
+    hash; the full hash is filled in only for files that needed it.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_INDEX):
+        self.path = path
+        self.entries: Dict[str, Dict[str, object]] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("files", {})
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        temp = self.path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": self.entries}, f, indent=1, sort_keys=True)
+        os.replace(temp, self.path)
+
+    def _entry(self, entry: os.DirEntry) -> Dict[str, object]:
+        stat = entry.stat(follow_symlinks=False)
+        cached = self.entries.get(entry.path)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached
+        fresh = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self.entries[entry.path] = fresh
+        return fresh
+
+    def prefix(self, path: str) -> str:
+        entry = self.entries[path]
+        if "prefix" not in entry:
+            entry["prefix"] = _hash_file(path, PREFIX_SIZE)
+        return entry["prefix"]
+
+    def digest(self, path: str) -> str:
+        entry = self.entries[path]
+        if "digest" not in entry:
+            # Files no bigger than one block were hashed in full already.
+            if entry["size"] <= PREFIX_SIZE:
+                entry["digest"] = self.prefix(path)
+            else:
+                entry["digest"] = _hash_file(path)
+        return entry["digest"]
+
+    def scan(self, roots: List[str]) -> List[List[str]]:
+        """
+        Index the given trees and return the groups of identical files.
+
+        The preferred copy of each group is an original rather than a
+        " (1)" copy, from the earliest root given, at the shallowest depth.
+
+        Returns:
+            Lists of two or more paths with the same content, each sorted
+            with the preferred copy first
+        """
+        by_size: Dict[int, List[str]] = defaultdict(list)
+        root_order: Dict[str, int] = {}
+        for order, root in enumerate(roots):
+            for entry in iter_files(root):
+                info = self._entry(entry)
+                root_order.setdefault(entry.path, order)
+                by_size[info["size"]].append(entry.path)
+
+        def preference(path: str):
+            copy = bool(_COPY_SUFFIX_RE.search(os.path.basename(path)))
+            return (copy, root_order[path], path.count(os.sep), path)
+
+        # Forget files that were deleted since the last scan.
+        for path in set(self.entries) - set(root_order):
+            if any(_is_below(path, root) for root in roots):
+                del self.entries[path]
+
+        groups = []
+        for size, paths in by_size.items():
+            if size == 0 or len(paths) < 2:
+                continue
+            by_prefix: Dict[str, List[str]] = defaultdict(list)
+            for path in paths:
+                by_prefix[self.prefix(path)].append(path)
+            for candidates in by_prefix.values():
+                if len(candidates) < 2:
+                    continue
+                by_digest: Dict[str, List[str]] = defaultdict(list)
+                for path in candidates:
+                    by_digest[self.digest(path)].append(path)
+                groups.extend(sorted(group, key=preference) for group in by_digest.values()
+                              if len(group) > 1)
+        groups.sort(key=lambda group: group[0])
+        return groups
+
+
+def _is_below(path: str, root: str) -> bool:
+    root = os.path.join(os.path.normpath(root), "")
+    return os.path.normpath(path).startswith(root)
+
+
+def build_manifest(groups: List[List[str]]) -> Dict[str, str]:
+    """Map every duplicate to the copy that should be published instead."""
+    return {duplicate: group[0] for group in groups for duplicate in group[1:]}
+
+
+def hardlink_duplicates(groups: List[List[str]]) -> int:
+    """
+    Replace duplicates with hardlinks to the first file of their group.
+
+    Each replacement goes through a temporary link and ``os.replace`` so a
+    failure never leaves a path missing. Files on another device are left
+    alone.
+
+    Returns:
+        Number of files replaced
+    """
+    replaced = 0
+    for group in groups:
+        original = group[0]
+        original_stat = os.stat(original)
+        for duplicate in group[1:]:
+            stat = os.stat(duplicate)
+            if stat.st_dev != original_stat.st_dev or stat.st_ino == original_stat.st_ino:
+                continue
+            temp = duplicate + ".dedupe-tmp"
+            os.link(original, temp)
+            os.replace(temp, duplicate)
+            replaced += 1
+    return replaced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find duplicate course materials by content.")
+    parser.add_argument("roots", nargs="+",
+                        help="directories to index; originals are taken from the first one")
+    parser.add_argument("--index", default=DEFAULT_INDEX,
+                        help="persistent index file (default: %(default)s)")
+    parser.add_argument("--manifest", help="write a duplicate -> original JSON manifest here")
+    parser.add_argument("--hardlink", action="store_true",
+                        help="replace duplicates with hardlinks to the original")
+    options = parser.parse_args()
+
+    index = ContentIndex(options.index)
+    groups = index.scan(options.roots)
+    index.save()
+
+    wasted = 0
+    for group in groups:
+        size = index.entries[group[0]]["size"]
+        wasted += size * (len(group) - 1)
+        print(f"{len(group)} copies, {size} bytes each:")
+        for path in group:
+            print(f"    {path}")
+    print(f"{len(groups)} duplicate groups, {wasted} redundant bytes")
+
+    if options.manifest:
+        with open(options.manifest, "w", encoding="utf-8") as f:
+            json.dump(build_manifest(groups), f, indent=2, sort_keys=True)
+            f.write("\n")
+    if options.hardlink:
+        print(f"replaced {hardlink_duplicates(groups)} files with hardlinks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Digit-sum engine behind sum_of_digits (Problem 27) in practice-problems-5.py.
+
+- Machine-sized integers in bulk: sum_of_digits_batch works on NumPy int
+  arrays, cutting each value into 4-digit groups with a few ``divmod``
+  steps and looking the groups up in a 10,000-entry table of digit sums.
+- Huge integers: the ``% 10`` loop is quadratic, and so is ``str()``, which
+  also refuses anything over ``sys.get_int_max_str_digits()`` digits (4300
+  by default). The engine splits the number in binary instead (shifts
+  and masks are linear), converts the halves recursively, and recombines
+  them as ``decimal.Decimal`` with cached powers of two. libmpdec multiplies
+  large Decimals in O(n log n), so a million-digit factorial converts in
+  about a second rather than a minute, and ``str()`` of the Decimal is
+  linear.
+
+Negative numbers have the digit sum of their absolute value.
+"""
+import decimal
+import math
+import operator
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+# Integers up to this many bits are converted directly rather than split.
+LEAF_BITS = 1 << 14
+
+# Integers up to this many bits (about 2,500 digits, under the default
+# int max-str-digits limit) are summed straight from str().
+STR_BITS = 1 << 13
+
+# digit sum of 0 .. 9999, indexed by value
+_DIGIT_SUMS = np.array([sum(map(int, str(value))) for value in range(10_000)], dtype=np.int32)
+
+_DIGIT_CHARS = tuple((digit, str(digit)) for digit in range(1, 10))
+
+# Unbounded precision: every operation below is exact.
+_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+# 2**k as a Decimal, for k = LEAF_BITS * 2**j; grows with the largest input seen.
+_POWERS_OF_TWO: Dict[int, decimal.Decimal] = {}
+
+
+def sum_of_digits(number: int) -> int:
+    """
+    Problem 27: Compute the sum of an integer's digits.
+
+    Example:
+        Input: 12
+        Output: 3 (because 1 + 2 = 3)
+
+    Args:
+        number: Integer whose digits should be summed
+
+    Returns:
+        Sum of the digits
+    """
+    number = abs(operator.index(number))
+    if number.bit_length() <= STR_BITS:
+        return _digit_sum_text(str(number))
+    return _digit_sum_text(str(to_decimal(number)))
+
+
+def _digit_sum_text(digits: str) -> int:
+    # Nine C-level counts instead of one int() per character.
+    return sum(digit * digits.count(char) for digit, char in _DIGIT_CHARS)
+
+
+def _power_of_two(bits: int) -> decimal.Decimal:
+    power = _POWERS_OF_TWO.get(bits)
+    if power is None:
+        if bits == LEAF_BITS:
+            power = decimal.Decimal(1 << bits)
+        else:
+            half = _power_of_two(bits // 2)
+            power = _CONTEXT.multiply(half, half)
+        _POWERS_OF_TWO[bits] = power
+    return power
+
+
+def to_decimal(number: int) -> decimal.Decimal:
+    """
+    Convert an int of any size to an exact Decimal in subquadratic time.
+
+    ``str()`` of the result gives the decimal digits without the
+    int max-str-digits limit.
+    """
+    bits = number.bit_length()
+    if bits <= LEAF_BITS:
+        return decimal.Decimal(number)
+    split = LEAF_BITS
+    while 2 * split < bits:
+        split *= 2
+    high = to_decimal(number >> split)
+    low = to_decimal(number & ((1 << split) - 1))
+    return _CONTEXT.add(_CONTEXT.multiply(high, _power_of_two(split)), low)
+
+
+def sum_of_digits_batch(numbers: Any) -> np.ndarray:
+    """
+    Digit sums of many integers at once.
+
+    Args:
+        numbers: Integers, as a NumPy integer array or anything np.asarray
+            accepts; values outside the int64/uint64 range go through
+            sum_of_digits one at a time
+
+    Returns:
+        int64 array of digit sums, the same shape as the input
+
+    Raises:
+        TypeError: If the input holds non-integers
+    """
+    array = np.asarray(numbers)
+    if array.dtype.kind == "f" and not isinstance(numbers, np.ndarray):
+        # An empty list, or huge ints mixed with small ones, comes out as
+        # float64; sum_of_digits rejects any real floats.
+        array = np.array(numbers, dtype=object)
+    if array.dtype.kind == "O":
+        sums = np.fromiter(map(sum_of_digits, array.ravel()), dtype=np.int64, count=array.size)
+        return sums.reshape(array.shape)
+    if array.dtype.kind not in "iub":
+        raise TypeError(f"expected integers, got an array of {array.dtype}")
+    if array.dtype.kind == "i":
+        # abs() of the most negative value wraps around to itself; read
+        # as unsigned of the same width it is the right magnitude.
+        array = np.abs(array).view(array.dtype.str.replace("i", "u"))
+    magnitude = array.astype(np.uint64, copy=False)
+    # At most 20 digits: 4 + 8 + 8. The two 8-digit parts fit in uint32,
+    # whose divisions are much cheaper than uint64 ones.
+    top, rest = np.divmod(magnitude, np.uint64(10**16))
+    middle, low = np.divmod(rest, np.uint64(10**8))
+    total = _DIGIT_SUMS[top]
+    for part in (middle.astype(np.uint32), low.astype(np.uint32)):
+        upper, lower = np.divmod(part, np.uint32(10_000))
+        total += _DIGIT_SUMS[upper]
+        total += _DIGIT_SUMS[lower]
+    return total.astype(np.int64)
+
+
+def _modulo_loop(number: int) -> int:
+    number = abs(number)
+    total = 0
+    while number:
+        total += number % 10
+        number //= 10
+    return total
+
+
+# Example usage: 10^7 machine integers, then factorials with up to a million digits
+def main():
+    rng = np.random.default_rng(0)
+    numbers = rng.integers(np.iinfo(np.int64).min, np.iinfo(np.int64).max, 10_000_000, endpoint=True)
+    started = time.perf_counter()
+    sums = sum_of_digits_batch(numbers)
+    batched = time.perf_counter() - started
+    sample = numbers[:100_000].tolist()
+    started = time.perf_counter()
+    assert [_modulo_loop(number) for number in sample] == sums[:100_000].tolist()
+    looped = (time.perf_counter() - started) * len(numbers) / len(sample)
+    print(f"{len(numbers):,} int64 values")
+    print(f"  sum_of_digits_batch: {batched:6.2f}s")
+    print(f"  % 10 loop per value: {looped:6.2f}s (extrapolated)")
+
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        for n in (5_000, 50_000, 200_000):
+            factorial = math.factorial(n)
+            started = time.perf_counter()
+            engine = sum_of_digits(factorial)
+            fast = time.perf_counter() - started
+            line = f"{n}! ({len(str(to_decimal(factorial))):,} digits): engine {fast:6.3f}s"
+            if n <= 50_000:
+                started = time.perf_counter()
+                assert _digit_sum_text(str(factorial)) == engine
+                line += f", str() {time.perf_counter() - started:6.3f}s"
+            if n <= 5_000:
+                started = time.perf_counter()
+                assert _modulo_loop(factorial) == engine
+                line += f", % 10 loop {time.perf_counter() - started:6.3f}s"
+            print(line)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+"""
+Reference answer for calculate_operations (practice-problems-1.py), which
+the solutions file calls calculate_expressions, plus an expression engine
+for generating and grading randomized operator-precedence drills such as
+``2 + 15 / 6 * 1 - 7 % 2``.
+
+compile_expression() parses a drill with ``ast``, rejects anything but
+numbers, variable names, parentheses and the arithmetic operators, folds
+constant subexpressions and compiles the result twice, once per
+evaluation mode. Compiled expressions are cached by their text.
+
+- Calling an Expression evaluates one instance with Python semantics,
+  ZeroDivisionError included.
+- Expression.evaluate() runs the vector code once over NumPy arrays of
+  variable bindings. Every operator goes through a helper that matches
+  Python on ints and floats and gives NaN where Python would raise
+  ZeroDivisionError. Int operations whose results could overflow int64
+  (``20 ** 20``, ``2**40 * 2**40``) are redone on object arrays of Python
+  ints, so they stay exact instead of wrapping; the result is then an
+  object array. Int ``//`` and ``%`` with a zero divisor also give an
+  object array, holding NaN in those rows only.
+
+Usage:
+    python -m coursetools.expressions                     # benchmark
+    python -m coursetools.expressions "a + b / c" -n 10   # random instances
+"""
+import argparse
+import ast
+import copy
+import math
+import operator
+import random
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+import numpy as np
+
+# Compiled expressions kept by compile_expression.
+CACHE_SIZE = 4096
+
+# Constant folding leaves larger powers to evaluation time.
+MAX_FOLDED_EXPONENT = 64
+
+# ... and int powers whose result could be longer than this many bits, so
+# nested powers such as ((9 ** 64) ** 64) ** 64 cannot blow up compilation.
+MAX_FOLDED_BITS = 1 << 12
+
+# Int results that may reach this magnitude are computed on Python ints.
+_INT64_SAFE = 2.0 ** 62
+
+# Ints up to this magnitude convert to float64 exactly.
+_FLOAT_EXACT = 2 ** 53
+
+OPERATIONS = (
+    "-1 + 4 * 6",
+    "(35 + 5) % 7",
+    "14 + -4 * 6 / 11",
+    "2 + 15 / 6 * 1 - 7 % 2",
+)
+
+_BINARY: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY: Dict[type, Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Operators the vector code routes through the helpers below.
+_VECTOR_HELPERS = {
+    ast.Add: "_add",
+    ast.Sub: "_subtract",
+    ast.Mult: "_multiply",
+    ast.Div: "_true_divide",
+    ast.FloorDiv: "_floor_divide",
+    ast.Mod: "_remainder",
+    ast.Pow: "_power",
+}
+
+
+def calculate_operations() -> list[float]:
+    """
+    Calculate the results of the following operations:
+    1. -1 + 4 * 6
+    2. (35 + 5) % 7
+    3. 14 + -4 * 6 / 11
+    4. 2 + 15 / 6 * 1 - 7 % 2
+
+    Returns:
+        list[float]: List containing the results of all operations
+    """
+    return [
+        -1 + 4 * 6,
+        (35 + 5) % 7,
+        14 + -4 * 6 / 11,
+        2 + 15 / 6 * 1 - 7 % 2,
+    ]
+
+
+def calculate_expressions() -> list[float]:
+    """
+    Calculates the results of specified arithmetic operations.
+
+    Returns:
+        list[float]: List of results from each calculation
+    """
+    return calculate_operations()
+
+
+def _check(tree: ast.AST) -> None:
+    """Raise ValueError for any node outside the arithmetic whitelist."""
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Expression, ast.Load)) or type(node) in _BINARY or type(node) in _UNARY:
+            continue
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+            continue
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+            continue
+        if isinstance(node, ast.Name) and not node.id.startswith("_"):
+            continue
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            continue
+        raise ValueError(f"unsupported syntax in expression: {ast.unparse(node) or type(node).__name__}")
+
+
+_NOT_LITERAL = object()
+
+
+def _literal(node: ast.AST) -> Any:
+    """The number a folded node stands for, or _NOT_LITERAL."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        return -node.operand.value
+    return _NOT_LITERAL
+
+
+def _make_literal(value: Any, node: ast.AST) -> ast.AST:
+    # Negative numbers stay unary minus: a negative Constant would unparse
+    # as "-8 ** 0.5", which reads back as -(8 ** 0.5).
+    if math.copysign(1, value) < 0:
+        literal = ast.UnaryOp(ast.USub(), ast.Constant(-value))
+    else:
+        literal = ast.Constant(value)
+    return ast.copy_location(literal, node)
+
+
+class _Folder(ast.NodeTransformer):
+    """Replace operations on numbers with their value."""
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        operand = _literal(node.operand)
+        if operand is _NOT_LITERAL:
+            return node
+        return _make_literal(_UNARY[type(node.op)](operand), node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        left, right = _literal(node.left), _literal(node.right)
+        if left is _NOT_LITERAL or right is _NOT_LITERAL:
+            return node
+        if isinstance(node.op, ast.Pow):
+            if abs(right) > MAX_FOLDED_EXPONENT:
+                return node
+            if isinstance(left, int) and isinstance(right, int) and abs(left).bit_length() * right > MAX_FOLDED_BITS:
+                return node
+        try:
+            value = _BINARY[type(node.op)](left, right)
+        except (ZeroDivisionError, OverflowError):
+            return node  # raised (or NaN) at evaluation time instead
+        if isinstance(value, complex):  # e.g. (-8) ** 0.5
+            return node
+        return _make_literal(value, node)
+
+
+class _Vectorizer(ast.NodeTransformer):
+    """Route the binary operators and unary minus through the NumPy helpers."""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        call = ast.Call(ast.Name(_VECTOR_HELPERS[type(node.op)], ast.Load()), [node.left, node.right], [])
+        return ast.copy_location(call, node)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.USub):
+            return node
+        return ast.copy_location(ast.Call(ast.Name("_negative", ast.Load()), [node.operand], []), node)
+
+
+class _Substitute(ast.NodeTransformer):
+    """Replace variable names with numbers, negative ones as unary minus."""
+
+    def __init__(self, values: Mapping[str, Any]):
+        self.values = values
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        value = self.values[node.id]
+        value = value.item() if isinstance(value, np.generic) else value
+        return _make_literal(value, node)
+
+
+def _is_int(array: np.ndarray) -> bool:
+    return array.dtype.kind in "iub"
+
+
+def _is_object(*arrays: np.ndarray) -> bool:
+    return any(array.dtype.kind == "O" for array in arrays)
+
+
+def _exact(function: Callable[[Any, Any], Any], bound: Callable[[np.ndarray, np.ndarray], np.ndarray],
+           a: Any, b: Any) -> np.ndarray:
+    """
+    Apply an int operation, on Python ints where int64 could overflow.
+
+    ``bound`` estimates the result's magnitude in float64 from the operands'
+    magnitudes; where any estimate reaches _INT64_SAFE, the operation is
+    redone on object arrays, as Python would compute it.
+    """
+    a, b = np.asarray(a), np.asarray(b)
+    if _is_int(a) and _is_int(b):
+        with np.errstate(over="ignore"):
+            magnitude = bound(np.abs(a.astype(np.float64)), np.abs(b.astype(np.float64)))
+        if (magnitude >= _INT64_SAFE).any():
+            return np.asarray(function(a.astype(object), b.astype(object)))
+    return np.asarray(function(a, b))
+
+
+def _add(a: Any, b: Any) -> np.ndarray:
+    return _exact(np.add, np.add, a, b)
+
+
+def _subtract(a: Any, b: Any) -> np.ndarray:
+    return _exact(np.subtract, np.add, a, b)
+
+
+def _multiply(a: Any, b: Any) -> np.ndarray:
+    return _exact(np.multiply, np.multiply, a, b)
+
+
+def _negative(a: Any) -> np.ndarray:
+    # -(-2**63) wraps around to itself in int64.
+    return _exact(lambda x, _: np.negative(x), lambda x, _: x, a, 0)
+
+
+def _true_divide(a: Any, b: Any) -> np.ndarray:
+    a, b = np.asarray(a), np.asarray(b)
+    zero = b == 0
+    wide = _is_int(a) and _is_int(b) and any(
+        (np.abs(x.astype(np.float64)) >= _FLOAT_EXACT).any() for x in (a, b))
+    if wide:
+        # Python rounds int / int once; converting to float64 first would
+        # round the operands too.
+        a, b = a.astype(object), b.astype(object)
+    if _is_object(a, b):
+        # Python ints raise rather than give inf; divide those rows by 1.
+        b = np.where(zero, 1, b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.true_divide(a, b)
+    result = np.where(zero, np.nan, result)
+    return result.astype(np.float64) if wide else result
+
+
+def _floor_divide(a: Any, b: Any) -> np.ndarray:
+    # |a // b| <= |a|, but -2**63 // -1 wraps around in int64.
+    return _integer_division(np.floor_divide, lambda x, _: x, a, b)
+
+
+def _remainder(a: Any, b: Any) -> np.ndarray:
+    # np.remainder takes the sign of the divisor, as Python's % does.
+    return _integer_division(np.remainder, lambda _, y: y, a, b)
+
+
+def _integer_division(function: np.ufunc, bound: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                      a: Any, b: Any) -> np.ndarray:
+    a, b = np.asarray(a), np.asarray(b)
+    zero = b == 0
+    if not zero.any():
+        return _exact(function, bound, a, b)
+    if _is_object(a, b) or (_is_int(a) and _is_int(b)):
+        # Ints have no NaN: divide the zero rows by 1, then give only those
+        # rows NaN in an object array, so the others stay exact ints.
+        result = _exact(function, bound, a, np.where(zero, 1, b)).astype(object)
+        return np.where(zero, np.nan, result)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = function(a, b)
+    return np.where(zero, np.nan, result)
+
+
+def _power(a: Any, b: Any) -> np.ndarray:
+    a, b = np.asarray(a), np.asarray(b)
+    # 0 ** -1 raises ZeroDivisionError in Python.
+    undefined = (a == 0) & (b < 0)
+    if undefined.any():
+        a = np.where(undefined, 1, a)
+    if _is_int(a) and _is_int(b) and (b < 0).any():
+        # Python gives a float for a negative int exponent (NumPy refuses)
+        # and an int for the others.
+        negative = b < 0
+        with np.errstate(over="ignore"):
+            fractions = np.power(a.astype(np.float64), b.astype(np.float64))
+        whole = _exact(np.power, np.power, a, np.where(negative, 0, b))
+        if whole.dtype.kind == "O" or (np.abs(whole) > _FLOAT_EXACT).any():
+            result = np.where(negative, fractions.astype(object), whole.astype(object))
+        else:
+            result = np.where(negative, fractions, whole)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = _exact(np.power, np.power, a, b)
+    if undefined.any():
+        result = np.where(undefined, np.nan, result)
+    return result
+
+
+_HELPERS = {
+    "__builtins__": {},
+    "_add": _add,
+    "_subtract": _subtract,
+    "_multiply": _multiply,
+    "_negative": _negative,
+    "_true_divide": _true_divide,
+    "_floor_divide": _floor_divide,
+    "_remainder": _remainder,
+    "_power": _power,
+}
+
+
+class Expression:
+    """A drill expression parsed, folded and compiled for both evaluation modes."""
+
+    def __init__(self, text: str):
+        tree = ast.parse(text.strip(), mode="eval")
+        _check(tree)
+        tree = ast.fix_missing_locations(_Folder().visit(tree))
+        self.text = text
+        self.folded = ast.unparse(tree)
+        self.names: Tuple[str, ...] = tuple(dict.fromkeys(
+            node.id for node in ast.walk(tree) if isinstance(node, ast.Name)))
+        self._scalar = compile(tree, "<expression>", "eval")
+        vector = ast.fix_missing_locations(_Vectorizer().visit(copy.deepcopy(tree)))
+        self._vector = compile(vector, "<expression>", "eval")
+
+    def __repr__(self) -> str:
+        return f"Expression({self.text!r})"
+
+    def __call__(self, **values: float) -> float:
+        """Evaluate one instance with Python semantics."""
+        self._require(values)
+        return eval(self._scalar, {"__builtins__": {}}, values)
+
+    def evaluate(self, bindings: Mapping[str, Any] = None, **arrays: Any) -> np.ndarray:
+        """
+        Evaluate the expression over arrays of variable bindings in one pass.
+
+        Args:
+            bindings: Variable name to array (or scalar); arrays broadcast
+            **arrays: More bindings, as keywords
+
+        Returns:
+            np.ndarray of results; NaN where Python would raise
+            ZeroDivisionError, and object dtype if any int result could
+            overflow int64 or an int // or % has a zero divisor
+        """
+        values = {name: np.asarray(value) for name, value in {**(bindings or {}), **arrays}.items()}
+        self._require(values)
+        return np.asarray(eval(self._vector, _HELPERS, values))
+
+    def instance(self, **values: float) -> str:
+        """The drill text with the variables replaced by the given numbers."""
+        self._require(values)
+        return ast.unparse(_Substitute(values).visit(ast.parse(self.text.strip(), mode="eval")))
+
+    def _require(self, values: Mapping[str, Any]) -> None:
+        missing = [name for name in self.names if name not in values]
+        if missing:
+            raise NameError(f"no value for {', '.join(missing)} in {self.text!r}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text: str) -> Expression:
+    """
+    Parse, check, fold and compile an expression, cached by its text.
+
+    Example:
+        Input: "2 + 15 / 6 * 1 - 7 % 2"
+        Output: Expression whose folded form is "3.5"
+
+    Args:
+        text: Arithmetic over numbers and variable names
+
+    Returns:
+        The compiled Expression
+
+    Raises:
+        SyntaxError: If the text is not a Python expression
+        ValueError: If it uses anything but + - * / // % ** and parentheses
+    """
+    return Expression(text)
+
+
+def random_drill(rng: random.Random, operators: int = 4, ops: str = "+-*/%") -> str:
+    """A random drill template such as ``a + b / c * d - e % f``."""
+    names = [chr(ord("a") + index) for index in range(operators + 1)]
+    parts = [names[0]]
+    for name in names[1:]:
+        parts.append(f" {rng.choice(ops)} {name}")
+    return "".join(parts)
+
+
+def random_bindings(expression: Expression, count: int, low: int = -20, high: int = 20,
+                    seed: int = 0) -> Dict[str, np.ndarray]:
+    """Random integer values in [low, high] for each variable of an expression."""
+    rng = np.random.default_rng(seed)
+    return {name: rng.integers(low, high + 1, count) for name in expression.names}
+
+
+def _same(expected: float, actual: float) -> bool:
+    return expected == actual or (math.isnan(expected) and math.isnan(actual))
+
+
+def _scalar_results(expression: Expression, bindings: Dict[str, np.ndarray], rows: int) -> List[float]:
+    columns = {name: values[:rows].tolist() for name, values in bindings.items()}
+    results = []
+    for row in range(rows):
+        try:
+            results.append(expression(**{name: column[row] for name, column in columns.items()}))
+        except ZeroDivisionError:
+            results.append(math.nan)
+    return results
+
+
+# Example usage: a million instances of one drill
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate operator-precedence drills.")
+    parser.add_argument("expression", nargs="?", help="drill template; omit to run the benchmark")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000, help="instances (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args()
+
+    assert [compile_expression(text)() for text in OPERATIONS] == calculate_operations()
+
+    if options.expression:
+        expression = compile_expression(options.expression)
+        bindings = random_bindings(expression, options.count, seed=options.seed)
+        results = expression.evaluate(bindings).tolist()
+        for row in range(min(options.count, 20)):
+            values = {name: column[row] for name, column in bindings.items()}
+            print(f"{expression.instance(**values)} = {results[row]!r}")
+        return
+
+    template = random_drill(random.Random(options.seed))
+    expression = compile_expression(template)
+    bindings = random_bindings(expression, options.count, seed=options.seed)
+
+    started = time.perf_counter()
+    results = expression.evaluate(bindings)
+    vectorized = time.perf_counter() - started
+
+    sample = min(options.count, 100_000)
+    started = time.perf_counter()
+    expected = _scalar_results(expression, bindings, sample)
+    per_row = (time.perf_counter() - started) * options.count / sample
+    assert all(map(_same, expected, results[:sample].tolist()))
+
+    print(f"{options.count:,} instances of {template}")
+    print(f"  Expression.evaluate: {vectorized:6.3f}s")
+    print(f"  eval per instance:   {per_row:6.2f}s (extrapolated)")
+    print(f"  compile cache:       {compile_expression.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Reference answer for get_file_size in practice-problems-6.py, plus tree
+sizing for the course material directories.
+
+get_tree_size walks with ``os.scandir``, so directory/file checks come from
+the ``DirEntry`` type cache and each file costs at most one ``stat``.
+Hardlinked files are counted once per ``(st_dev, st_ino)``. Subdirectories
+can be listed on a thread pool, which helps on network filesystems and cold
+caches since ``scandir`` and ``stat`` release the GIL.
+
+A TreeSizeCache keeps each directory's listing keyed by the directory's
+mtime. A repeat scan stats every directory but only re-lists (and re-stats
+the files of) directories whose mtime changed. Adding, removing or renaming
+a file changes its directory's mtime; rewriting a file in place does not, so
+a cached scan can miss a file that grew without being replaced.
+
+Usage:
+    python -m coursetools.filesize materials "Coda Export Joshua Aaron's Webpage"
+    python -m coursetools.filesize materials --cache .tree-size-cache.json
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+DEFAULT_CACHE = ".tree-size-cache.json"
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# One directory's contents: {"mtime_ns": int, "files": {name: size},
+# "links": {name: [st_dev, st_ino]} for files with st_nlink > 1,
+# "dirs": [name, ...]}
+Listing = Dict[str, object]
+
+
+def get_file_size(file_path: str) -> int:
+    """
+    Problem 29: Find the size of a specified file in bytes.
+
+    Example:
+        Input: "example.txt"
+        Output: 31 (bytes)
+
+    Args:
+        file_path: Path to the file to check
+
+    Returns:
+        Size of the file in bytes, or -1 if file doesn't exist
+    """
+    try:
+        return os.stat(file_path).st_size
+    except OSError:
+        return -1
+
+
+class TreeSizeCache:
+    """
+    Persistent map from directory path to its last listing.
+
+    Entries are reused while the directory's mtime is unchanged.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE):
+        self.path = path
+        self.entries: Dict[str, Listing] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("directories", {})
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        temp = self.path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "directories": self.entries}, f, separators=(",", ":"))
+        os.replace(temp, self.path)
+
+    def forget_missing(self, root: str, visited: Set[str]) -> None:
+        """Drop entries below ``root`` that the last scan did not reach."""
+        prefix = os.path.join(root, "")
+        for path in [path for path in self.entries if path not in visited]:
+            if path == root or path.startswith(prefix):
+                del self.entries[path]
+
+
+def _list_directory(path: str, cached: Optional[Listing]) -> Optional[Listing]:
+    try:
+        # Read the mtime before listing: a change made during the listing
+        # leaves a newer mtime behind, so the next scan lists it again.
+        mtime_ns = os.stat(path).st_mtime_ns
+        if cached is not None and cached["mtime_ns"] == mtime_ns:
+            return cached
+        files: Dict[str, int] = {}
+        links: Dict[str, list] = {}
+        dirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files[entry.name] = stat.st_size
+                        if stat.st_nlink > 1:
+                            links[entry.name] = [stat.st_dev, stat.st_ino]
+                except OSError:
+                    continue  # removed while listing
+    except OSError:
+        return None  # unreadable or removed; skipped like os.walk does
+    return {"mtime_ns": mtime_ns, "files": files, "links": links, "dirs": dirs}
+
+
+def _walk(root: str, workers: int, entries: Dict[str, Listing]) -> Iterator[Tuple[str, Listing]]:
+    if workers <= 1:
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            listing = _list_directory(path, entries.get(path))
+            if listing is not None:
+                stack.extend(os.path.join(path, name) for name in listing["dirs"])
+                yield path, listing
+        return
+
+    with ThreadPoolExecutor(workers) as pool:
+        pending = {pool.submit(_list_directory, root, entries.get(root)): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                listing = future.result()
+                if listing is None:
+                    continue
+                for name in listing["dirs"]:
+                    child = os.path.join(path, name)
+                    pending[pool.submit(_list_directory, child, entries.get(child))] = child
+                yield path, listing
+
+
+def iter_file_sizes(
+    root: str,
+    workers: int = 1,
+    cache: Optional[TreeSizeCache] = None,
+    dedupe_hardlinks: bool = True,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Yield ``(path, size)`` for every regular file below a directory.
+
+    Symlinks are not followed, and directories that cannot be read are
+    skipped. With ``workers > 1`` directories are listed concurrently and
+    files come out in no particular order.
+
+    Example:
+        Input: "materials"
+        Output: ("materials/practice-problems-6.py", 3655), ...
+
+    Args:
+        root: Directory to walk
+        workers: Threads listing directories; 1 walks in the calling thread
+        cache: Listings to reuse, updated in place (call ``cache.save()``)
+        dedupe_hardlinks: Yield only the first path seen for each inode
+
+    Returns:
+        Iterator of (path, size in bytes) pairs
+    """
+    if not os.path.isdir(root):
+        size = get_file_size(root)
+        if size >= 0:
+            yield root, size
+        return
+
+    entries = cache.entries if cache is not None else {}
+    seen_inodes: Set[Tuple[int, int]] = set()
+    visited: Set[str] = set()
+    for path, listing in _walk(root, workers, entries):
+        visited.add(path)
+        if cache is not None:
+            cache.entries[path] = listing
+        links = listing["links"]
+        for name, size in listing["files"].items():
+            if dedupe_hardlinks and name in links:
+                inode = tuple(links[name])
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+            yield os.path.join(path, name), size
+    if cache is not None:
+        cache.forget_missing(root, visited)
+
+
+def get_tree_size(root: str, workers: int = DEFAULT_WORKERS, cache: Optional[TreeSizeCache] = None) -> int:
+    """
+    Find the total size of all files below a directory, in bytes.
+
+    Hardlinks are counted once. A plain file path gives that file's size.
+
+    Example:
+        Input: "materials"
+        Output: 52428800 (bytes)
+
+    Args:
+        root: Directory (or file) to measure
+        workers: Threads listing directories
+        cache: Listings to reuse, updated in place (call ``cache.save()``)
+
+    Returns:
+        Total size in bytes, or -1 if root doesn't exist
+    """
+    if not os.path.exists(root):
+        return -1
+    return sum(size for _, size in iter_file_sizes(root, workers, cache))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the size of directory trees.")
+    parser.add_argument("roots", nargs="+", help="directories to measure")
+    parser.add_argument("-j", "--workers", type=int, default=DEFAULT_WORKERS,
+                        help="threads listing directories (default: %(default)s)")
+    parser.add_argument("--cache", help="persistent listing cache, e.g. " + DEFAULT_CACHE)
+    parser.add_argument("--list", action="store_true", help="print every file with its size")
+    options = parser.parse_args()
+
+    cache = TreeSizeCache(options.cache) if options.cache else None
+    for root in options.roots:
+        started = time.perf_counter()
+        if options.list:
+            total = 0
+            for path, size in iter_file_sizes(root, options.workers, cache):
+                print(f"{size:>12}  {path}")
+                total += size
+        else:
+            total = get_tree_size(root, options.workers, cache)
+        print(f"{total:>12}  {root}  ({time.perf_counter() - started:.2f}s)")
+    if cache is not None:
+        cache.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Reference answer for find_most_frequent_number in practice-problems-other.py,
+plus a streaming version for inputs that do not fit in memory.
+
+The streaming version counts exactly with a Counter until the number of
+distinct values passes ``max_counters``. From then on it keeps a Misra-Gries
+summary of at most ``max_counters`` candidates, and a second pass over the
+source counts those candidates exactly. The "smallest value wins ties" rule
+is applied to the exact counts in both cases. A one-shot iterator cannot be
+read twice, so past the cap its answer is the best Misra-Gries candidate,
+with a lower bound for its count.
+"""
+import os
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable, Iterator, List, NamedTuple, Union
+
+# Values read from the source per step. Counting a whole chunk with
+# Counter.update runs at C speed, which is what makes multi-GB streams
+# practical.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Bytes read from a file per step when parsing integers.
+DEFAULT_READ_SIZE = 1 << 20
+
+Source = Union[str, "os.PathLike[str]", Iterable[int]]
+
+
+class ModeResult(NamedTuple):
+    """Most frequent value found in a stream."""
+
+    value: int
+    count: int  # a lower bound when exact is False for a one-shot iterator
+    exact: bool  # False only if a Misra-Gries run could not prove the answer
+
+
+def find_most_frequent_number(numbers: list[int]) -> int:
+    """
+    Problem: Given a list of integers, find the number that appears most frequently.
+    If there are multiple numbers that appear the same number of times, return the smallest one.
+
+    Example:
+    Input: [1, 2, 3, 2, 4, 2, 1]
+    Output: 2 (appears 3 times)
+
+    Parameters:
+        numbers (list[int]): List of integers
+    Returns:
+        int: The most frequent number in the list
+    """
+    counts = Counter(numbers)
+    if not counts:
+        raise ValueError("numbers must not be empty")
+    return min(counts.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+def iter_integer_chunks(path: Union[str, "os.PathLike[str]"], read_size: int = DEFAULT_READ_SIZE) -> Iterator[List[int]]:
+    """
+    Read whitespace-separated integers from a file in chunks.
+
+    Parameters:
+        path: File containing integers separated by spaces or newlines
+        read_size (int): Bytes read per step
+    Yields:
+        list[int]: The integers parsed from each block
+    """
+    with open(path, "rb") as f:
+        tail = b""
+        while True:
+            block = f.read(read_size)
+            if not block:
+                break
+            block = tail + block
+            tokens = block.split()
+            # The last token may continue in the next block.
+            if not block[-1:].isspace():
+                tail = tokens.pop() if tokens else b""
+            else:
+                tail = b""
+            if tokens:
+                yield list(map(int, tokens))
+        if tail:
+            yield [int(tail)]
+
+
+def _iter_chunks(source: Source, chunk_size: int) -> Iterator[List[int]]:
+    if isinstance(source, (str, os.PathLike)):
+        yield from iter_integer_chunks(source)
+        return
+    iterator = iter(source)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _shrink(summary: Counter, keep: int) -> Counter:
+    """
+    Misra-Gries reduction: keep the ``keep`` largest counters and subtract
+    the next largest count from each of them.
+
+    Every value's count is underestimated by at most that amount, and the
+    summary total drops by at least ``keep + 1`` times it, so the error over
+    the whole stream stays below total / (keep + 1).
+    """
+    ranked = sorted(summary.items(), key=itemgetter(1), reverse=True)
+    threshold = ranked[keep][1]
+    return Counter({value: count - threshold for value, count in ranked[:keep]})
+
+
+def _pick(counts: Counter) -> tuple:
+    return min(counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+def most_frequent_stream(
+    source: Source,
+    max_counters: int = 1_000_000,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ModeResult:
+    """
+    Find the most frequent integer in a stream, at bounded memory.
+
+    Memory is capped at roughly ``max_counters`` distinct values plus one
+    chunk. If the cap is never reached the answer comes straight from exact
+    counts. Otherwise the Misra-Gries candidates are re-counted with a
+    second pass over a file path or re-iterable collection. A one-shot
+    iterator (``iter(source) is source``) cannot be read again, so once it
+    passes the cap the single pass is finished and the candidate with the
+    largest Misra-Gries count is returned with ``exact=False``; that count
+    is at most total / (max_counters // 2 + 1) below the true one.
+
+    The verified answer is exact whenever its count exceeds
+    total / (max_counters // 2 + 1), since no value that frequent can be
+    missing from the candidates. ``ModeResult.exact`` is False otherwise.
+
+    Example:
+    Input: iter([1, 2, 3, 2, 4, 2, 1])
+    Output: ModeResult(value=2, count=3, exact=True)
+
+    Parameters:
+        source: Path to a file of integers, or any iterable of integers
+        max_counters (int): Maximum number of distinct values tracked
+        chunk_size (int): Values counted per step for iterable sources
+    Returns:
+        ModeResult: The most frequent value, its count and whether it is proven
+    Raises:
+        ValueError: If the source is empty
+    """
+    if max_counters < 2:
+        raise ValueError("max_counters must be at least 2")
+    one_shot = not isinstance(source, (str, os.PathLike)) and iter(source) is source
+    # Shrinking to half the cap leaves headroom, so the sort in _shrink runs
+    # once per max_counters / 2 new values rather than on every chunk.
+    keep = max_counters // 2
+    summary: Counter = Counter()
+    total = 0
+    overflowed = False
+    for chunk in _iter_chunks(source, chunk_size):
+        summary.update(chunk)
+        total += len(chunk)
+        if len(summary) > max_counters:
+            summary = _shrink(summary, keep)
+            overflowed = True
+    if total == 0:
+        raise ValueError("source must not be empty")
+    if not overflowed:
+        value, count = _pick(summary)
+        return ModeResult(value, count, True)
+    if one_shot:
+        # Nothing left to verify against: report the summary's best guess.
+        value, count = _pick(summary)
+        return ModeResult(value, count, False)
+
+    candidates = set(summary)
+    verified: Counter = Counter()
+    for chunk in _iter_chunks(source, chunk_size):
+        verified.update(filter(candidates.__contains__, chunk))
+    value, count = _pick(verified)
+    return ModeResult(value, count, count * (keep + 1) > total)
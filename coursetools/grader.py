@@ -0,0 +1,475 @@
+"""
+Auto-grader for the practice-problem modules.
+
+Test cases come from the reference skeleton itself: every top-level function
+and ``@staticmethod`` is discovered with ``ast`` (the skeleton is never
+imported), and the examples in its docstring are turned into cases. The
+docstring formats used across materials/practice-problems-*.py are
+understood:
+
+    Input: 25, 4                  Output: 29
+    Input: x=5, y=6, z=7          Output: (77, 72)  # comment
+    Input arrays: [1] and [2]     Output: 2 (explanation)
+    Expected Output: 824693       (functions without parameters)
+    >>> f(15)                     True  # comment
+    Expected Output (for input 5):
+        555
+        ...                       (compared against printed output)
+
+Submissions are graded in parallel, each in its own worker process, under
+a wall-clock timeout and an address-space limit; the parent kills workers
+that overrun the timeout. Results are written as JSON.
+
+Usage:
+    python -m coursetools.grader materials/practice-problems-4.py submissions/ -o results.json
+"""
+import argparse
+import ast
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import multiprocessing
+import multiprocessing.connection
+import os
+import re
+import signal
+import sys
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no memory limits
+    resource = None
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MEMORY_MB = 512
+
+# Seconds past its timeout before the parent kills a worker outright.
+DEFAULT_GRACE = 2.0
+
+_INPUT_RE = re.compile(r"^\s*Input(?:\s+\w+)?\s*:\s*(.+)$")
+_OUTPUT_RE = re.compile(r"^\s*(?:Expected\s+|Example\s+)?Output\s*:\s*(.*)$")
+_STDOUT_RE = re.compile(r"^(\s*)Expected Output \(for input (.+)\)\s*:\s*$")
+_DOCTEST_RE = re.compile(r"^\s*>>>\s*(.+)$")
+_TRAILING_NOTE_RE = re.compile(r"\s*\([^()]*\)\s*$")
+
+
+class TestCase(NamedTuple):
+    """One example call extracted from a docstring."""
+
+    function: str  # "Class.method" for static methods
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    expected: Any
+    stdout: bool = False  # compare printed output instead of the return value
+
+
+class _SubmissionTimeout(Exception):
+    pass
+
+
+def _contains_ellipsis(value: Any) -> bool:
+    if value is Ellipsis:
+        return True
+    if isinstance(value, (list, tuple, set)):
+        return any(_contains_ellipsis(item) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_ellipsis(item) for item in value.values())
+    return False
+
+
+def _parse_literal(text: str) -> Any:
+    """
+    Parse an example output, dropping a trailing "(explanation)".
+
+    Raises:
+        ValueError: If no literal can be read, or the value is elided with "..."
+    """
+    for candidate in (text, _TRAILING_NOTE_RE.sub("", text)):
+        try:
+            value = ast.literal_eval(candidate.strip())
+        except (SyntaxError, ValueError):
+            continue
+        if _contains_ellipsis(value):
+            raise ValueError(f"elided example output: {text!r}")
+        return value
+    raise ValueError(f"cannot parse example output: {text!r}")
+
+
+def _parse_arguments(text: str) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Parse example inputs such as ``25, 4``, ``x=5, y=6`` or ``[1] and [2]``.
+
+    Raises:
+        ValueError: If the text is not a list of literal arguments
+    """
+    for candidate in (text, text.replace(" and ", ", ")):
+        try:
+            call = ast.parse(f"f({candidate.strip()})", mode="eval").body
+            args = tuple(ast.literal_eval(arg) for arg in call.args)
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+        except (SyntaxError, ValueError):
+            continue
+        return args, kwargs
+    raise ValueError(f"cannot parse example input: {text!r}")
+
+
+def _parse_output_block(lines: List[str], start: int, first: str) -> Tuple[Any, int]:
+    """Parse an output that may continue over the following lines."""
+    text = first
+    end = start
+    while True:
+        try:
+            return _parse_literal(text), end
+        except ValueError:
+            if end + 1 >= len(lines) or not text or text[0] not in "[{(":
+                raise
+            end += 1
+            text += "\n" + lines[end]
+
+
+def _cases_from_docstring(function: str, docstring: str, parameter_count: int) -> Iterator[TestCase]:
+    lines = docstring.splitlines()
+    pending: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        try:
+            stdout_match = _STDOUT_RE.match(line)
+            doctest_match = _DOCTEST_RE.match(line)
+            input_match = _INPUT_RE.match(line)
+            output_match = _OUTPUT_RE.match(line)
+            if stdout_match:
+                indent = len(stdout_match.group(1))
+                args, kwargs = _parse_arguments(stdout_match.group(2))
+                block = []
+                while i + 1 < len(lines) and lines[i + 1].strip() and \
+                        len(lines[i + 1]) - len(lines[i + 1].lstrip()) > indent:
+                    i += 1
+                    block.append(lines[i].strip())
+                if block and not any("..." in row or "<" in row for row in block):
+                    yield TestCase(function, args, kwargs, "\n".join(block) + "\n", stdout=True)
+            elif doctest_match:
+                call = ast.parse(doctest_match.group(1), mode="eval").body
+                if not isinstance(call, ast.Call):
+                    raise ValueError("doctest line is not a call")
+                args = tuple(ast.literal_eval(arg) for arg in call.args)
+                kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+                if i + 1 < len(lines):
+                    i += 1
+                    yield TestCase(function, args, kwargs, _parse_literal(lines[i]))
+            elif input_match:
+                pending = _parse_arguments(input_match.group(1))
+            elif output_match and output_match.group(1).strip():
+                expected, i = _parse_output_block(lines, i, output_match.group(1).strip())
+                if pending is not None:
+                    yield TestCase(function, pending[0], pending[1], expected)
+                elif parameter_count == 0:
+                    yield TestCase(function, (), {}, expected)
+                pending = None
+        except (SyntaxError, ValueError):
+            # Prose that looks like an example; not gradeable.
+            pending = None
+        i += 1
+
+
+def _iter_functions(tree: ast.Module) -> Iterator[Tuple[str, ast.FunctionDef]]:
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            yield node.name, node
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and any(
+                    isinstance(d, ast.Name) and d.id == "staticmethod" for d in item.decorator_list
+                ):
+                    yield f"{node.name}.{item.name}", item
+
+
+def extract_cases(reference_path: str) -> List[TestCase]:
+    """
+    Collect the docstring examples of every function in a practice module.
+
+    Args:
+        reference_path: Path to the practice-problem file
+
+    Returns:
+        Test cases in source order
+    """
+    with open(reference_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=reference_path)
+    cases = []
+    for name, node in _iter_functions(tree):
+        if name.split(".")[-1].startswith("_") or name == "main":
+            continue
+        docstring = ast.get_docstring(node)
+        if docstring:
+            cases.extend(_cases_from_docstring(name, docstring, len(node.args.args)))
+    return cases
+
+
+def _matches(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        return type(expected) is type(actual) and expected == actual
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+    if isinstance(expected, (list, tuple)):
+        return type(expected) is type(actual) and len(expected) == len(actual) and all(
+            _matches(e, a) for e, a in zip(expected, actual)
+        )
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and expected.keys() == actual.keys() and all(
+            _matches(expected[key], actual[key]) for key in expected
+        )
+    return expected == actual
+
+
+def _resolve(module: Any, function: str) -> Any:
+    target = module
+    for part in function.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _on_alarm(signum, frame):
+    raise _SubmissionTimeout()
+
+
+def limit_memory(memory_mb: Optional[int]) -> None:
+    """Cap the worker's address space."""
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _case_report(case: TestCase) -> Dict[str, Any]:
+    arguments = [repr(arg) for arg in case.args] + [f"{k}={v!r}" for k, v in case.kwargs.items()]
+    return {
+        "function": case.function,
+        "input": ", ".join(arguments),
+        "expected": repr(case.expected),
+        "passed": False,
+    }
+
+
+def grade_submission(path: str, cases: List[TestCase], timeout: float) -> Dict[str, Any]:
+    """
+    Run every case against one submission.
+
+    Runs inside a worker process. The timeout covers importing the
+    submission and all of its cases; once it fires, the remaining cases
+    fail.
+
+    Args:
+        path: Path to the student's file
+        cases: Cases from extract_cases
+        timeout: Wall-clock seconds allowed for the whole submission
+
+    Returns:
+        JSON-ready report for the submission
+    """
+    reports = [_case_report(case) for case in cases]
+    result = {"submission": path, "status": "ok", "error": None, "passed": 0,
+              "total": len(cases), "cases": reports}
+    use_alarm = hasattr(signal, "setitimer") and timeout > 0
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        module_name = f"_submission_{abs(hash(path))}"
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+        for case, report in zip(cases, reports):
+            captured = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(captured):
+                    actual = _resolve(module, case.function)(*case.args, **case.kwargs)
+            except (_SubmissionTimeout, MemoryError):
+                raise
+            except BaseException as exc:  # student code may raise anything, even SystemExit
+                report["error"] = f"{type(exc).__name__}: {exc}"
+                continue
+            if case.stdout:
+                actual = captured.getvalue()
+            report["actual"] = repr(actual)
+            report["passed"] = _matches(case.expected, actual)
+    except _SubmissionTimeout:
+        result["status"] = "timeout"
+        result["error"] = f"exceeded {timeout:g}s"
+    except MemoryError:
+        result["status"] = "memory"
+        result["error"] = "exceeded memory limit"
+    except BaseException as exc:
+        result["status"] = "error"
+        result["error"] = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        sys.stdin = stdin
+    result["passed"] = sum(report["passed"] for report in reports)
+    return result
+
+
+def find_submissions(directory: str, reference_name: str) -> List[str]:
+    """
+    List the submissions in a directory.
+
+    A submission is either a ``.py`` file directly inside ``directory`` or,
+    for per-student folders, a file named like the reference inside a
+    subdirectory.
+    """
+    found = []
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        if entry.is_file() and entry.name.endswith(".py"):
+            found.append(entry.path)
+        elif entry.is_dir():
+            candidate = os.path.join(entry.path, reference_name)
+            if os.path.isfile(candidate):
+                found.append(candidate)
+    return found
+
+
+def _failed(path: str, cases: List[TestCase], status: str, error: str) -> Dict[str, Any]:
+    """Report for a submission whose worker never sent one back."""
+    return {"submission": path, "status": status, "error": error, "passed": 0,
+            "total": len(cases), "cases": [_case_report(case) for case in cases]}
+
+
+def _grade_in_worker(connection: Connection, path: str, cases: List[TestCase],
+                     timeout: float, memory_mb: Optional[int]) -> None:
+    """Worker process body: grade one submission and send the report back."""
+    limit_memory(memory_mb)
+    try:
+        result = grade_submission(path, cases, timeout)
+    except BaseException as exc:
+        result = _failed(path, cases, "error", f"{type(exc).__name__}: {exc}")
+    connection.send(result)
+    connection.close()
+
+
+def grade_directory(
+    reference_path: str,
+    submissions_dir: str,
+    workers: Optional[int] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: Optional[int] = DEFAULT_MEMORY_MB,
+    skip: Tuple[str, ...] = (),
+) -> Dict[str, Any]:
+    """
+    Grade every submission in a directory against a practice module.
+
+    Each submission gets a fresh worker process, so one student's global
+    state (or monkey-patching) cannot leak into the next, and a worker that
+    dies only costs its own submission. The alarm inside the worker can be
+    caught by student code, or never delivered while it is stuck in C
+    (``10**10**8``), so the parent also kills any worker still running
+    DEFAULT_GRACE seconds past its timeout.
+
+    Args:
+        reference_path: Practice-problem file the cases are extracted from
+        submissions_dir: Directory of student submissions
+        workers: Worker processes (defaults to the CPU count)
+        timeout: Seconds allowed per submission; 0 for no limit
+        memory_mb: Address-space limit per worker, or None for no limit
+        skip: Function names to leave out, e.g. ones that need fixture files
+
+    Returns:
+        JSON-ready report for the whole run
+    """
+    cases = [case for case in extract_cases(reference_path)
+             if case.function not in skip and case.function.split(".")[-1] not in skip]
+    paths = find_submissions(submissions_dir, os.path.basename(reference_path))
+    workers = workers or os.cpu_count() or 1
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = list(reversed(paths))
+    # path -> (process, receiving end, deadline)
+    running: Dict[str, Tuple[multiprocessing.Process, Connection, float]] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                path = pending.pop()
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_grade_in_worker, args=(sender, path, cases, timeout, memory_mb), daemon=True)
+                process.start()
+                sender.close()
+                deadline = time.monotonic() + timeout + DEFAULT_GRACE if timeout > 0 else math.inf
+                running[path] = (process, receiver, deadline)
+
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            wait_for = None if next_deadline == math.inf else max(0.0, next_deadline - time.monotonic())
+            multiprocessing.connection.wait(
+                [receiver for _, receiver, _ in running.values()], timeout=wait_for)
+
+            now = time.monotonic()
+            for path, (process, receiver, deadline) in list(running.items()):
+                if receiver.poll():
+                    try:
+                        results[path] = receiver.recv()
+                    except EOFError:
+                        # Died before reporting: os._exit, a segfault, SIGXCPU.
+                        process.join()
+                        results[path] = _failed(path, cases, "crashed",
+                                                f"worker process died (exit code {process.exitcode})")
+                elif now >= deadline:
+                    process.kill()
+                    results[path] = _failed(path, cases, "timeout",
+                                            f"exceeded {timeout:g}s; worker killed")
+                else:
+                    continue
+                process.join()
+                receiver.close()
+                del running[path]
+    finally:
+        for process, receiver, _ in running.values():
+            process.kill()
+            process.join()
+            receiver.close()
+    return {
+        "reference": reference_path,
+        "cases": len(cases),
+        "submissions": [results[path] for path in paths],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade practice-problem submissions.")
+    parser.add_argument("reference", help="practice-problem file with the docstring examples")
+    parser.add_argument("submissions", nargs="?", help="directory of student submissions")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds per submission (default: %(default)s)")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_MB,
+                        help="memory limit per worker, 0 for none (default: %(default)s)")
+    parser.add_argument("--skip", action="append", default=[],
+                        help="function to leave out; may be repeated")
+    parser.add_argument("--list-cases", action="store_true",
+                        help="print the extracted cases and exit")
+    options = parser.parse_args()
+
+    if options.list_cases or options.submissions is None:
+        report = [_case_report(case) for case in extract_cases(options.reference)]
+        for item in report:
+            del item["passed"]
+    else:
+        report = grade_directory(options.reference, options.submissions, options.workers,
+                                 options.timeout, options.memory_mb or None, tuple(options.skip))
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Reference answer for hex_to_decimal in practice-problems-6.py, plus a batch
+version for parsing millions of hex IDs at once.
+
+The batch version works on newline-delimited bytes: a list of strings is
+joined once, and ``bytes``, ``mmap.mmap`` and other buffers are read in
+place. Each byte goes through a 256-entry digit table with one NumPy
+lookup, and every line of up to 16 digits is assembled into a ``uint64``
+four bits per column. Longer lines fall back to ``int(line, 16)``, and
+lines with bad digits are reported rather than stopping the batch.
+
+Lines may carry a ``0x`` prefix and a ``\\r`` before the newline.
+"""
+import mmap
+import os
+import random
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# Bytes parsed per step; bounds the temporary arrays for huge files.
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+# Hex digits that always fit in a uint64.
+MAX_DIGITS = 16
+
+INVALID = 255
+SEPARATOR = 254
+_NEWLINE = ord("\n")
+_CR = ord("\r")
+
+HEX_DIGITS = np.full(256, INVALID, dtype=np.uint8)
+for _value, _char in enumerate(b"0123456789abcdef"):
+    HEX_DIGITS[_char] = _value
+for _value, _char in enumerate(b"ABCDEF", start=10):
+    HEX_DIGITS[_char] = _value
+HEX_DIGITS[_NEWLINE] = SEPARATOR
+
+
+class HexBatch(NamedTuple):
+    """Parsed lines of a batch, indexed by line number."""
+
+    values: np.ndarray  # uint64; 0 wherever ok is False
+    ok: np.ndarray  # bool; True where values holds the line's value
+    big: Dict[int, int]  # values that do not fit in a uint64
+    invalid: Dict[int, List[Tuple[int, str]]]  # (column, character) of each bad digit; [] if empty
+
+    def to_list(self) -> List[Optional[int]]:
+        """Every line's value as a Python int, or None for invalid lines."""
+        result: List[Optional[int]] = self.values.tolist()
+        for line in np.flatnonzero(~self.ok).tolist():
+            result[line] = self.big.get(line)
+        return result
+
+
+def hex_to_decimal(hex_number: str) -> int:
+    """
+    Problem 30: Convert a hexadecimal number to decimal.
+
+    Example:
+        Input: "4B0"
+        Output: 1200
+
+    Args:
+        hex_number: String representation of hexadecimal number
+
+    Returns:
+        Decimal (base-10) value of the number
+    """
+    return int(hex_number, 16)
+
+
+def _describe(byte: int) -> str:
+    return chr(byte) if 32 <= byte < 127 else f"\\x{byte:02x}"
+
+
+def _fixed_width(starts: np.ndarray, lengths: np.ndarray) -> bool:
+    if len(starts) > 1 and np.any(np.diff(starts) != starts[1] - starts[0]):
+        return False
+    return bool(np.all(lengths == lengths[0]))
+
+
+def _parse_lines(chunk: np.ndarray, first_line: int, batch: HexBatch) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a block of complete lines; fills batch.big and batch.invalid."""
+    newlines = np.flatnonzero(chunk == _NEWLINE)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(chunk)]))
+    if len(chunk) and chunk[-1] == _NEWLINE:
+        starts, ends = starts[:-1], ends[:-1]
+    if not len(starts):
+        return np.zeros(0, np.uint64), np.zeros(0, bool)
+    last = len(chunk) - 1
+
+    ends = ends - ((ends > starts) & (chunk[np.clip(ends - 1, 0, last)] == _CR))
+    line_starts = starts
+    prefixed = (
+        (ends - starts > 2)
+        & (chunk[np.minimum(starts, last)] == ord("0"))
+        & ((chunk[np.minimum(starts + 1, last)] | 0x20) == ord("x"))
+    )
+    starts = starts + 2 * prefixed
+    lengths = ends - starts
+    digits = HEX_DIGITS[chunk]
+
+    ok = lengths > 0
+    bad = np.flatnonzero(digits == INVALID)
+    if bad.size:
+        lines = np.searchsorted(starts, bad, side="right") - 1
+        inside = (lines >= 0) & (bad < ends[np.maximum(lines, 0)])
+        bad, lines = bad[inside], lines[inside]
+        ok[lines] = False
+        for line, position in zip(lines.tolist(), bad.tolist()):
+            batch.invalid.setdefault(first_line + line, []).append(
+                (position - int(line_starts[line]), _describe(int(chunk[position])))
+            )
+    for line in np.flatnonzero(lengths == 0).tolist():
+        batch.invalid[first_line + line] = []
+
+    long_lines = np.flatnonzero(ok & (lengths > MAX_DIGITS))
+    ok[long_lines] = False
+    values = np.zeros(len(starts), dtype=np.uint64)
+    rows = np.flatnonzero(ok)
+    if rows.size == len(starts) and _fixed_width(starts, lengths):
+        # Every line valid and the same width (the usual shape of an ID
+        # dump): the digits already form a strided 2-D array.
+        width = int(lengths[0])
+        step = int(starts[1] - starts[0]) if len(starts) > 1 else width
+        lines_view = as_strided(digits[starts[0]:], shape=(len(starts), width),
+                                strides=(step, 1), writeable=False)
+        nibbles = np.zeros((len(starts), MAX_DIGITS), dtype=np.uint8)
+        nibbles[:, MAX_DIGITS - width:] = lines_view
+    elif rows.size:
+        # Gather each line's last 16 digits into a row, right-aligned. Shorter
+        # lines point their leading columns at the byte before the line (a
+        # newline, the "x" of "0x", or the padding byte), zeroed here.
+        padded = np.zeros(len(chunk) + 1, dtype=np.uint8)
+        padded[1:] = digits
+        padded[starts[rows]] = 0
+        columns = ends[rows, None] + np.arange(1 - MAX_DIGITS, 1)
+        nibbles = padded[np.maximum(columns, starts[rows, None])]
+    if rows.size:
+        # Two nibbles per byte, then read each row of 8 bytes as a big-endian uint64.
+        packed = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+        values[rows] = packed.view(">u8").ravel()
+
+    # Leading zeros can make a long line fit after all.
+    for line in long_lines.tolist():
+        value = int(chunk[starts[line]:ends[line]].tobytes(), 16)
+        if value < 1 << 64:
+            values[line] = value
+            ok[line] = True
+        else:
+            batch.big[first_line + line] = value
+    return values, ok
+
+
+def _iter_blocks(data: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """Split a byte array into blocks that end on a line boundary."""
+    start = 0
+    while start < len(data):
+        stop = start + chunk_size
+        while stop < len(data):
+            newlines = np.flatnonzero(data[start:stop] == _NEWLINE)
+            if newlines.size:
+                stop = start + int(newlines[-1]) + 1
+                break
+            stop += chunk_size  # a single line longer than chunk_size
+        yield data[start:stop]
+        start = stop
+
+
+def _as_bytes(source: Any) -> np.ndarray:
+    if isinstance(source, (list, tuple)):
+        # Every item ends its own line, so a trailing "" is kept as a line too.
+        text = "".join(item + "\n" for item in source)
+        if text.count("\n") != len(source):
+            raise ValueError("hex strings must not contain newlines")
+        # One byte per character keeps reported columns in characters.
+        return np.frombuffer(text.encode("ascii", errors="replace"), dtype=np.uint8)
+    return np.frombuffer(source, dtype=np.uint8)
+
+
+def hex_to_decimal_batch(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> HexBatch:
+    """
+    Convert many hexadecimal numbers to decimal at once.
+
+    Example:
+        Input: ["4B0", "ff", "0x10", "12g4"]
+        Output: HexBatch(values=array([1200, 255, 16, 0], dtype=uint64),
+                         ok=array([True, True, True, False]), big={},
+                         invalid={3: [(2, 'g')]})
+
+    Args:
+        source: List of hex strings, or a newline-delimited bytes-like
+            buffer such as ``bytes`` or ``mmap.mmap``
+        chunk_size: Bytes parsed per step
+
+    Returns:
+        HexBatch with one entry per line
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    batch = HexBatch(np.zeros(0, np.uint64), np.zeros(0, bool), {}, {})
+    values, ok = [], []
+    first_line = 0
+    for block in _iter_blocks(_as_bytes(source), chunk_size):
+        block_values, block_ok = _parse_lines(block, first_line, batch)
+        values.append(block_values)
+        ok.append(block_ok)
+        first_line += len(block_values)
+    if values:
+        batch = batch._replace(values=np.concatenate(values), ok=np.concatenate(ok))
+    return batch
+
+
+def hex_file_to_decimal(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> HexBatch:
+    """
+    Convert a file of newline-separated hex numbers, memory-mapping it.
+
+    Args:
+        path: File with one hex number per line
+        chunk_size: Bytes parsed per step
+
+    Returns:
+        HexBatch with one entry per line
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hex_to_decimal_batch(b"", chunk_size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            batch = hex_to_decimal_batch(mapped, chunk_size)
+    return batch
+
+
+# Example usage: ten million 64-bit IDs, batch versus one int() per line
+def main():
+    count = 10_000_000
+    lines = [f"{random.getrandbits(64):016x}" for _ in range(count)]
+    data = "\n".join(lines).encode("ascii") + b"\n"
+
+    started = time.perf_counter()
+    expected = [int(line, 16) for line in lines]
+    naive = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = hex_to_decimal_batch(data)
+    batched = time.perf_counter() - started
+
+    assert batch.ok.all() and batch.values.tolist() == expected
+    print(f"int(line, 16):        {naive:.2f}s")
+    print(f"hex_to_decimal_batch: {batched:.2f}s  ({len(data) / batched / 1e6:.0f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
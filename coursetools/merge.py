@@ -0,0 +1,188 @@
+"""
+Reference answer for MergeSortedArrays, the first C# problem in
+practice-problems-other.py, plus a streaming k-way merge for inputs that do
+not fit in memory.
+
+merge_sorted_chunks works like ``heapq.merge`` over sources that yield
+sorted NumPy chunks instead of single values: each step takes every
+buffered value up to the smallest "last value in the buffer" across the
+sources, sorts that slice (a few presorted runs, so NumPy's stable sort
+merges them in linear time) and yields it. Memory is one chunk per source.
+"""
+import heapq
+import os
+import tempfile
+import time
+from typing import Iterable, Iterator, List, Union
+
+import numpy as np
+
+from coursetools.frequency import iter_integer_chunks
+
+# Bytes read per step when parsing a sorted text file.
+DEFAULT_READ_SIZE = 1 << 20
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def merge_sorted_arrays(arr1: List[int], arr2: List[int]) -> List[int]:
+    """
+    Problem: Given two sorted arrays of integers, merge them into a single sorted array.
+
+    Example:
+    Input: arr1 = [1, 3, 5], arr2 = [2, 4, 6]
+    Output: [1, 2, 3, 4, 5, 6]
+
+    Parameters:
+        arr1 (list[int]): First sorted array
+        arr2 (list[int]): Second sorted array
+    Returns:
+        list[int]: Merged sorted array containing all elements from both input arrays
+    """
+    # Timsort finds the two presorted runs and merges them in O(n + m).
+    return sorted(arr1 + arr2)
+
+
+def _checked(source: Iterable[np.ndarray], number: int) -> Iterator[np.ndarray]:
+    """Yield the non-empty chunks of a source, checking that it is sorted."""
+    previous = None
+    for chunk in source:
+        chunk = np.asarray(chunk)
+        if not len(chunk):
+            continue
+        if (previous is not None and chunk[0] < previous) or np.any(chunk[1:] < chunk[:-1]):
+            raise ValueError(f"source {number} is not sorted")
+        previous = chunk[-1]
+        yield chunk
+
+
+def merge_sorted_chunks(*sources: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+    """
+    Merge any number of sorted sources into one sorted stream of chunks.
+
+    Each source is an iterable of 1-D arrays whose concatenation is sorted,
+    such as iter_sorted_file() or ``np.array_split(array, n)``. Total work
+    is O(n + m) for two sources and O(n log k) for k; memory is one chunk
+    per source.
+
+    Example:
+    Input: [np.array([1, 3, 5])], [np.array([2, 4]), np.array([6])]
+    Output: array([1, 2, 3, 4]), array([5]), array([6])
+
+    Parameters:
+        sources: Iterables of sorted chunks
+    Yields:
+        np.ndarray: Sorted chunks of the merged stream
+    Raises:
+        ValueError: If a source turns out not to be sorted
+    """
+    iterators = [_checked(source, number) for number, source in enumerate(sources)]
+    buffers = []
+    for iterator in iterators:
+        chunk = next(iterator, None)
+        if chunk is not None:
+            buffers.append([chunk, iterator])
+
+    while len(buffers) > 1:
+        # Everything up to the smallest buffered maximum can be emitted:
+        # no source can produce a smaller value later.
+        limit = min(chunk[-1] for chunk, _ in buffers)
+        parts = []
+        for entry in buffers:
+            chunk = entry[0]
+            cut = int(np.searchsorted(chunk, limit, side="right"))
+            parts.append(chunk[:cut])
+            entry[0] = chunk[cut:]
+        merged = np.concatenate(parts)
+        merged.sort(kind="stable")
+        yield merged
+
+        remaining = []
+        for entry in buffers:
+            if not len(entry[0]):
+                entry[0] = next(entry[1], None)
+                if entry[0] is None:
+                    continue
+            remaining.append(entry)
+        buffers = remaining
+
+    if buffers:
+        chunk, iterator = buffers[0]
+        yield chunk
+        yield from iterator
+
+
+def iter_sorted_file(path: Path, read_size: int = DEFAULT_READ_SIZE) -> Iterator[np.ndarray]:
+    """
+    Stream a text file of sorted, whitespace-separated integers as int64 chunks.
+
+    Parameters:
+        path: File to read
+        read_size (int): Bytes read per step
+    Yields:
+        np.ndarray: The integers of each block
+    """
+    for values in iter_integer_chunks(path, read_size):
+        yield np.array(values, dtype=np.int64)
+
+
+def merge_sorted_files(paths: List[Path], out_path: Path) -> int:
+    """
+    Merge sorted integer files into one, one integer per line, streaming.
+
+    Parameters:
+        paths (list): Files of sorted, whitespace-separated integers
+        out_path: File to write
+    Returns:
+        int: Number of integers written
+    """
+    written = 0
+    with open(out_path, "w", encoding="ascii") as out:
+        for chunk in merge_sorted_chunks(*(iter_sorted_file(path) for path in paths)):
+            out.write("\n".join(map(str, chunk.tolist())))
+            out.write("\n")
+            written += len(chunk)
+    return written
+
+
+# Example usage: merging 10^7 integers
+def main():
+    rng = np.random.default_rng(0)
+    left = np.sort(rng.integers(0, 10**9, 5_000_000))
+    right = np.sort(rng.integers(0, 10**9, 5_000_000))
+    expected = np.sort(np.concatenate([left, right]), kind="stable")
+    left_list, right_list = left.tolist(), right.tolist()
+
+    started = time.perf_counter()
+    merged = merge_sorted_arrays(left_list, right_list)
+    merged_lists = time.perf_counter() - started
+    assert merged == expected.tolist()
+    del merged
+
+    started = time.perf_counter()
+    merged = list(heapq.merge(left_list, right_list))
+    heap = time.perf_counter() - started
+    del merged
+
+    started = time.perf_counter()
+    chunks = list(merge_sorted_chunks(np.array_split(left, 50), np.array_split(right, 50)))
+    chunked = time.perf_counter() - started
+    assert np.array_equal(np.concatenate(chunks), expected)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        paths = [os.path.join(scratch, name) for name in ("left.txt", "right.txt")]
+        for path, values in zip(paths, (left, right)):
+            np.savetxt(path, values, fmt="%d")
+        started = time.perf_counter()
+        count = merge_sorted_files(paths, os.path.join(scratch, "merged.txt"))
+        from_files = time.perf_counter() - started
+
+    print("Merging two sorted arrays of 5,000,000 integers")
+    print(f"  merge_sorted_arrays (lists): {merged_lists:.2f}s")
+    print(f"  heapq.merge (lists):         {heap:.2f}s")
+    print(f"  merge_sorted_chunks:         {chunked:.2f}s")
+    print(f"  merge_sorted_files:          {from_files:.2f}s ({count:,} lines written)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Reference answer for is_valid_palindrome in practice-problems-other.py,
+plus file and batch versions.
+
+- is_valid_palindrome: two pointers moving inwards, filtering and
+  lowercasing as they go; extra memory is a few chunks, whatever the length
+- is_palindrome_file: memory-maps a UTF-8 file and compares chunks read
+  from both ends, so a multi-GB file needs only a few chunks of memory
+- are_palindromes: checks a list of strings on a process pool and returns
+  a boolean NumPy array
+"""
+import mmap
+import os
+import random
+import string
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+# Characters each pointer advances per step in is_valid_palindrome.
+DEFAULT_TEXT_CHUNK = 1 << 16
+
+# Bytes read from each end per step in is_palindrome_file.
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+# Strings sent to a worker per task in are_palindromes.
+DEFAULT_BATCH_SIZE = 10_000
+
+# Longest UTF-8 character; is_palindrome_file never reads fewer bytes a step.
+_UTF8_MAX_BYTES = 4
+
+# ASCII fast path: lowercase A-Z and delete every other non-alphanumeric byte.
+_ASCII_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_ASCII_NOT_ALNUM = bytes(set(range(128)) - set((string.ascii_letters + string.digits).encode()))
+
+
+def is_valid_palindrome(s: str, chunk_size: int = DEFAULT_TEXT_CHUNK) -> bool:
+    """
+    Problem: Check if a string is a valid palindrome after converting all characters
+    to lowercase and removing all non-alphanumeric characters.
+
+    Two pointers move inwards from both ends. They advance a chunk at a
+    time rather than a character at a time, so the filtering and case
+    folding run at C speed, and extra memory stays at a few chunks however
+    long the string is.
+
+    Example:
+    Input: "A man, a plan, a canal: Panama"
+    Output: True
+
+    Parameters:
+        s (str): Input string to check
+        chunk_size (int): Characters each pointer advances per step
+    Returns:
+        bool: True if the string is a palindrome, False otherwise
+    """
+    return _meet_in_the_middle(len(s), chunk_size, lambda start, stop: _normalize_text(s[start:stop]))
+
+
+def _normalize_text(text: str) -> str:
+    """Alphanumeric characters of ``text``, each lowercased."""
+    if text.isascii():
+        return text.encode("ascii").translate(_ASCII_LOWER, _ASCII_NOT_ALNUM).decode("ascii")
+    # Lowercase one character at a time: str.lower() on a whole chunk is
+    # context-sensitive (final sigma), so results could depend on chunking.
+    return "".join(map(str.lower, filter(str.isalnum, text)))
+
+
+def _normalize(data: bytes) -> str:
+    """Alphanumeric characters of a UTF-8 chunk, each lowercased."""
+    if data.isascii():
+        return data.translate(_ASCII_LOWER, _ASCII_NOT_ALNUM).decode("ascii")
+    return _normalize_text(data.decode("utf-8", errors="replace"))
+
+
+def _meet_in_the_middle(
+    length: int,
+    chunk_size: int,
+    read: Callable[[int, int], str],
+    boundary: Callable[[int], int] = lambda position: position,
+) -> bool:
+    """
+    Compare normalized text read from the front with normalized text read
+    from the back until the two positions meet.
+
+    ``read(start, stop)`` returns the normalized text of a range, and
+    ``boundary`` moves a position back to where a range may be split.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    front, back = 0, length
+    # Normalized characters read but not yet matched; back_pending holds its
+    # characters in reverse (read-from-the-end) order.
+    front_pending, back_pending = "", ""
+    while back - front > 2 * chunk_size:
+        # Read from whichever end is behind, so neither pending string
+        # grows past about one chunk.
+        if len(front_pending) <= len(back_pending):
+            split = boundary(front + chunk_size)
+            front_pending += read(front, split)
+            front = split
+        else:
+            split = boundary(back - chunk_size)
+            back_pending += read(split, back)[::-1]
+            back = split
+
+        matched = min(len(front_pending), len(back_pending))
+        if front_pending[:matched] != back_pending[:matched]:
+            return False
+        front_pending = front_pending[matched:]
+        back_pending = back_pending[matched:]
+
+    rest = front_pending + read(front, back) + back_pending[::-1]
+    return rest == rest[::-1]
+
+
+def _char_start(mapped: mmap.mmap, position: int) -> int:
+    """Move a byte offset back to the start of the UTF-8 character it is in."""
+    while 0 < position < len(mapped) and mapped[position] & 0xC0 == 0x80:
+        position -= 1
+    return position
+
+
+def is_palindrome_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+    """
+    Check whether a UTF-8 text file is a valid palindrome, in bounded memory.
+
+    The file is memory-mapped and read ``chunk_size`` bytes at a time from
+    the front and from the back, with chunk edges moved to character
+    boundaries, exactly as is_valid_palindrome walks a string. Chunks are
+    at least 4 bytes, so each one holds a whole character.
+
+    Example:
+    Input: "panama.txt" containing "A man, a plan, a canal: Panama"
+    Output: True
+
+    Parameters:
+        path (str): File to check
+        chunk_size (int): Bytes read from each end per step
+    Returns:
+        bool: True if the file's text is a palindrome, False otherwise
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    # A smaller chunk could end inside the first character, and moving that
+    # edge back to a character boundary would make no progress.
+    chunk_size = max(chunk_size, _UTF8_MAX_BYTES)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _meet_in_the_middle(
+                len(mapped),
+                chunk_size,
+                lambda start, stop: _normalize(mapped[start:stop]),
+                lambda position: _char_start(mapped, position),
+            )
+
+
+def _check_batch(strings: Sequence[str]) -> bytes:
+    # Short strings: one filtered copy each is cheapest.
+    result = bytearray(len(strings))
+    for index, s in enumerate(strings):
+        cleaned = _normalize_text(s)
+        result[index] = cleaned == cleaned[::-1]
+    return bytes(result)
+
+
+def are_palindromes(
+    strings: Sequence[str],
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> np.ndarray:
+    """
+    Check many strings at once on a process pool.
+
+    Strings are sent to the workers ``batch_size`` at a time, and each batch
+    comes back as one bytes object. Lists no longer than one batch, or
+    ``workers=1``, are checked in the calling process.
+
+    Example:
+    Input: ["A man, a plan, a canal: Panama", "race a car", ""]
+    Output: array([ True, False,  True])
+
+    Parameters:
+        strings (list[str]): Strings to check
+        workers (int): Worker processes (default: one per CPU)
+        batch_size (int): Strings per worker task
+    Returns:
+        np.ndarray: Boolean array, True where the string is a palindrome
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    if workers == 1 or len(strings) <= batch_size:
+        flags = _check_batch(strings)
+    else:
+        batches = [strings[start:start + batch_size] for start in range(0, len(strings), batch_size)]
+        with ProcessPoolExecutor(workers) as pool:
+            flags = b"".join(pool.map(_check_batch, batches))
+    return np.frombuffer(flags, dtype=np.uint8).astype(bool)
+
+
+def _random_sentence(length: int) -> str:
+    half = "".join(random.choice(string.ascii_letters + "  ,.") for _ in range(length // 2))
+    return half + half[::-1] if random.random() < 0.5 else half + half
+
+
+# Example usage: one long text, a large file and a million short strings
+def main():
+    text = "A man, a plan, a canal: Panama " * 300_000
+    text = text + text[::-1]
+
+    started = time.perf_counter()
+    cleaned = [c.lower() for c in text if c.isalnum()]
+    copy_result = cleaned == cleaned[::-1]
+    copied = time.perf_counter() - started
+    del cleaned
+
+    started = time.perf_counter()
+    pointer_result = is_valid_palindrome(text)
+    pointers = time.perf_counter() - started
+    assert copy_result == pointer_result
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "palindrome.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(10):
+                f.write(text)
+                text = text[::-1]
+        size = os.path.getsize(path)
+        started = time.perf_counter()
+        file_result = is_palindrome_file(path)
+        from_file = time.perf_counter() - started
+        assert file_result
+
+    print(f"{len(text):,} characters")
+    print(f"  filtered copy:      {copied:.2f}s")
+    print(f"  two pointers:       {pointers:.2f}s (bounded extra memory)")
+    print(f"{size / 1e6:.0f} MB file")
+    print(f"  is_palindrome_file: {from_file:.2f}s")
+
+    strings: List[str] = [_random_sentence(40) for _ in range(1_000_000)]
+    started = time.perf_counter()
+    serial = are_palindromes(strings, workers=1)
+    one = time.perf_counter() - started
+    started = time.perf_counter()
+    pooled = are_palindromes(strings)
+    many = time.perf_counter() - started
+    assert (serial == pooled).all()
+    print(f"{len(strings):,} short strings ({int(pooled.sum()):,} palindromes)")
+    print(f"  one process:        {one:.2f}s")
+    print(f"  process pool:       {many:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
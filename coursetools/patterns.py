@@ -0,0 +1,200 @@
+"""
+Reference answers for the printed-pattern problems:
+print_multiplication_table (practice-problems-2.py) and
+print_number_rectangle (practice-problems-3.py).
+
+The exercises print one line at a time. For generating golden-master output
+across thousands of inputs, the render_* functions build a whole block as
+one string from a format template compiled once per shape, and keep recent
+blocks in an LRU keyed by (number, width, height). The write_* functions
+render many numbers and hand the result to the stream in a single write.
+"""
+import contextlib
+import io
+import os
+import time
+from functools import lru_cache
+from typing import Iterable, TextIO
+
+# Rendered blocks kept per pattern.
+CACHE_SIZE = 4096
+
+TABLE_ROWS = 11  # multipliers 0 to 10
+RECTANGLE_WIDTH = 3
+RECTANGLE_HEIGHT = 5
+
+
+def print_multiplication_table(number: int) -> None:
+    """
+    Print the multiplication table for a given number from 0 to 10.
+
+    Args:
+        number (int): The number to create multiplication table for
+
+    Expected Output:
+        5 * 0 = 0
+        5 * 1 = 5
+        5 * 2 = 10
+        ...
+        5 * 10 = 50
+    """
+    print(render_multiplication_table(number), end="")
+
+
+def print_number_rectangle(number: int) -> None:
+    """
+    Print a rectangle pattern using a number (3 columns wide and 5 rows tall).
+
+    Args:
+        number (int): The number to use in the pattern
+
+    Expected Output (for input 5):
+        555
+        5 5
+        5 5
+        5 5
+        555
+    """
+    print(render_number_rectangle(number), end="")
+
+
+@lru_cache(maxsize=None)
+def _table_template(width: int, height: int) -> str:
+    # "{0} * 0 = {1:>width}\n{0} * 1 = {2:>width}\n..."
+    field = f":>{width}" if width else ""
+    return "".join(f"{{0}} * {row} = {{{row + 1}{field}}}\n" for row in range(height))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def render_multiplication_table(number: int, width: int = 0, height: int = TABLE_ROWS) -> str:
+    """
+    Render a multiplication table as one string.
+
+    Args:
+        number (int): The number to create multiplication table for
+        width (int): Minimum width of the product column (0 for no padding)
+        height (int): Number of rows; multipliers run from 0 to height - 1
+
+    Returns:
+        str: All lines of the table, each ending in a newline
+    """
+    return _table_template(width, height).format(number, *(number * row for row in range(height)))
+
+
+@lru_cache(maxsize=None)
+def _rectangle_template(width: int, height: int) -> str:
+    # "{0}{0}{0}\n{0}{1}{0}\n...": {1} is the blank middle of a row.
+    edge = "{0}" * width + "\n"
+    if height == 1:
+        return edge
+    middle = ("{0}{1}{0}\n" if width > 1 else "{0}\n") * (height - 2)
+    return edge + middle + edge
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def render_number_rectangle(
+    number: int,
+    width: int = RECTANGLE_WIDTH,
+    height: int = RECTANGLE_HEIGHT,
+) -> str:
+    """
+    Render a hollow rectangle of a number as one string.
+
+    Args:
+        number (int): The number to use in the pattern
+        width (int): Columns, counted in copies of the number
+        height (int): Rows
+
+    Returns:
+        str: All lines of the rectangle, each ending in a newline
+    """
+    if width < 1 or height < 1:
+        raise ValueError("width and height must be at least 1")
+    text = str(number)
+    return _rectangle_template(width, height).format(text, " " * (len(text) * (width - 2)))
+
+
+def write_multiplication_tables(
+    numbers: Iterable[int],
+    out: TextIO,
+    width: int = 0,
+    height: int = TABLE_ROWS,
+    separator: str = "",
+) -> int:
+    """
+    Write the multiplication tables of many numbers with a single write.
+
+    Args:
+        numbers: Numbers to render
+        out: Text stream to write to
+        width (int): Minimum width of the product column
+        height (int): Rows per table
+        separator (str): Text written between tables
+
+    Returns:
+        int: Number of characters written
+    """
+    text = separator.join(render_multiplication_table(number, width, height) for number in numbers)
+    return out.write(text)
+
+
+def write_number_rectangles(
+    numbers: Iterable[int],
+    out: TextIO,
+    width: int = RECTANGLE_WIDTH,
+    height: int = RECTANGLE_HEIGHT,
+    separator: str = "",
+) -> int:
+    """
+    Write the number rectangles of many numbers with a single write.
+
+    Args:
+        numbers: Numbers to render
+        out: Text stream to write to
+        width (int): Columns per rectangle
+        height (int): Rows per rectangle
+        separator (str): Text written between rectangles
+
+    Returns:
+        int: Number of characters written
+    """
+    text = separator.join(render_number_rectangle(number, width, height) for number in numbers)
+    return out.write(text)
+
+
+def _print_tables_line_by_line(numbers: Iterable[int]) -> None:
+    for number in numbers:
+        for row in range(TABLE_ROWS):
+            print(f"{number} * {row} = {number * row}")
+
+
+# Example usage: golden masters for many inputs, line by line versus batched
+def main():
+    numbers = list(range(-500, 500)) * 50
+
+    with open(os.devnull, "w") as sink:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            _print_tables_line_by_line(numbers)
+        per_line = time.perf_counter() - started
+
+        render_multiplication_table.cache_clear()
+        started = time.perf_counter()
+        write_multiplication_tables(numbers, sink)
+        batched = time.perf_counter() - started
+
+    reference = io.StringIO()
+    with contextlib.redirect_stdout(reference):
+        _print_tables_line_by_line(numbers[:100])
+    batch = io.StringIO()
+    write_multiplication_tables(numbers[:100], batch)
+    assert batch.getvalue() == reference.getvalue()
+
+    print(f"{len(numbers):,} multiplication tables ({len(set(numbers)):,} distinct)")
+    print(f"  print() per line:            {per_line:.2f}s")
+    print(f"  write_multiplication_tables: {batched:.2f}s")
+    print(f"  cache: {render_multiplication_table.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
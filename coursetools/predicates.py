@@ -0,0 +1,549 @@
+"""
+Reference answers for practice-problems-4.py, with array-in/array-out
+versions for property-testing submissions on millions of inputs.
+
+Each *_batch function broadcasts over NumPy arrays (or anything
+``np.asarray`` accepts) and matches the scalar answer exactly, including
+ties (equal numbers), zero (neither negative nor positive) and the
+inclusive "within 20" boundaries. Values large enough to overflow int64
+arithmetic are computed on object arrays of Python ints instead.
+
+differential_test compares a student's scalar function against a batch
+reference. The reference runs on every input; the student's function is
+called only on a sample: random inputs plus the edge cases the reference
+marks (ties, boundaries), since that is where wrong answers cluster. Every
+sampled input where the two disagree is reported. check_submission runs
+a student's file in a forked worker process, under the grader's timeout
+and memory limit, so a submission that loops forever or exits cannot take
+the caller down with it.
+
+Usage:
+    python -m coursetools.predicates                    # benchmark
+    python -m coursetools.predicates submission.py      # differential test
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import sys
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from coursetools.grader import DEFAULT_MEMORY_MB, DEFAULT_TIMEOUT, limit_memory
+
+# Inputs generated per function by check_submission.
+DEFAULT_INPUTS = 1_000_000
+
+# Student calls per function: random inputs plus as many edge cases.
+DEFAULT_SAMPLE_SIZE = 10_000
+
+# Beyond this magnitude, sums and triples could overflow int64.
+_INT64_SAFE = 1 << 60
+
+# References hold lambdas, which only a forked worker can receive; where
+# there is no fork (Windows), submissions run in the calling process.
+_FORK = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def check_negative_positive(num1: int, num2: int) -> bool:
+    """
+    Check if one number is negative and one is positive.
+
+    Args:
+        num1 (int): First integer
+        num2 (int): Second integer
+
+    Returns:
+        bool: True if one is negative and one is positive, False otherwise
+
+    Examples:
+        Input: -5, 25
+        Output: True
+
+        Input: 5, 25
+        Output: False
+
+        Input: -5, -25
+        Output: False
+    """
+    return (num1 < 0 < num2) or (num2 < 0 < num1)
+
+
+def compute_triple_sum(num1: int, num2: int) -> int:
+    """
+    Compute the sum of two integers. If the values are the same,
+    return triple their sum.
+
+    Args:
+        num1 (int): First integer
+        num2 (int): Second integer
+
+    Returns:
+        int: Sum of numbers, or triple the sum if numbers are equal
+
+    Examples:
+        Input: 5, 5
+        Output: 30  # (5 + 5) * 3
+
+        Input: 5, 6
+        Output: 11  # 5 + 6
+    """
+    total = num1 + num2
+    return total * 3 if num1 == num2 else total
+
+
+def get_absolute_difference(num1: int, num2: int) -> int:
+    """
+    Get absolute difference between two numbers. Return double the absolute
+    difference if first number is greater than second number.
+
+    Args:
+        num1 (int): First integer
+        num2 (int): Second integer
+
+    Returns:
+        int: Absolute difference or double the absolute difference
+
+    Examples:
+        Input: 25, 15
+        Output: 20  # (25 - 15) * 2
+
+        Input: 15, 25
+        Output: 10  # |15 - 25|
+    """
+    difference = abs(num1 - num2)
+    return difference * 2 if num1 > num2 else difference
+
+
+def check_sum_twenty(num1: int, num2: int) -> bool:
+    """
+    Check if one of the numbers is 20 or if their sum is 20.
+
+    Args:
+        num1 (int): First integer
+        num2 (int): Second integer
+
+    Returns:
+        bool: True if one number is 20 or sum is 20, False otherwise
+
+    Examples:
+        Input: 20, 5
+        Output: True  # One number is 20
+
+        Input: 15, 5
+        Output: True  # Sum is 20
+
+        Input: 15, 6
+        Output: False # Neither number is 20 and sum isn't 20
+    """
+    return num1 == 20 or num2 == 20 or num1 + num2 == 20
+
+
+def is_within_twenty(number: int) -> bool:
+    """
+    Check if the given integer is within 20 of 100 or 200.
+
+    Args:
+        number (int): Integer to check
+
+    Returns:
+        bool: True if number is within 20 of 100 or 200, False otherwise
+
+    Examples:
+        Input: 115
+        Output: True  # Within 20 of 100
+
+        Input: 190
+        Output: True  # Within 20 of 200
+
+        Input: 25
+        Output: False # Not within 20 of either 100 or 200
+    """
+    return abs(number - 100) <= 20 or abs(number - 200) <= 20
+
+
+def as_int_arrays(*values: Any) -> Tuple[np.ndarray, ...]:
+    """
+    Broadcast integer inputs against each other.
+
+    Returns int64 arrays, or object arrays of Python ints when any value is
+    large enough that the predicates' arithmetic could overflow int64.
+    """
+    arrays = np.broadcast_arrays(*(_as_array(value) for value in values))
+    if all(array.dtype.kind in "iub" and _fits_int64(array) for array in arrays):
+        return tuple(array.astype(np.int64) for array in arrays)
+    return tuple(array.astype(object) for array in arrays)
+
+
+def _as_array(value: Any) -> np.ndarray:
+    array = np.asarray(value)
+    if array.dtype.kind in "fO" and not isinstance(value, np.ndarray):
+        # NumPy turns a list mixing small ints with ints past int64 into
+        # float64; keep such lists as exact Python ints instead.
+        exact = np.array(value, dtype=object)
+        if all(isinstance(item, int) for item in exact.flat):
+            return exact
+    return array
+
+
+def _fits_int64(array: np.ndarray) -> bool:
+    return array.size == 0 or (int(array.min()) > -_INT64_SAFE and int(array.max()) < _INT64_SAFE)
+
+
+def _same_dtype(result: Any, like: np.ndarray) -> np.ndarray:
+    # Arithmetic on 0-d object arrays returns bare Python ints; keep them
+    # as object arrays so np.where does not try to squeeze them into int64.
+    return np.asarray(result, dtype=like.dtype)
+
+
+def check_negative_positive_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of check_negative_positive."""
+    num1, num2 = as_int_arrays(num1, num2)
+    return np.asarray(((num1 < 0) & (num2 > 0)) | ((num1 > 0) & (num2 < 0)), dtype=bool)
+
+
+def compute_triple_sum_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of compute_triple_sum."""
+    num1, num2 = as_int_arrays(num1, num2)
+    total = num1 + num2
+    return np.where(num1 == num2, _same_dtype(total * 3, num1), _same_dtype(total, num1))
+
+
+def get_absolute_difference_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of get_absolute_difference."""
+    num1, num2 = as_int_arrays(num1, num2)
+    difference = abs(num1 - num2)
+    return np.where(num1 > num2, _same_dtype(difference * 2, num1), _same_dtype(difference, num1))
+
+
+def check_sum_twenty_batch(num1: Any, num2: Any) -> np.ndarray:
+    """Array version of check_sum_twenty."""
+    num1, num2 = as_int_arrays(num1, num2)
+    return np.asarray((num1 == 20) | (num2 == 20) | (num1 + num2 == 20), dtype=bool)
+
+
+def is_within_twenty_batch(number: Any) -> np.ndarray:
+    """Array version of is_within_twenty."""
+    (number,) = as_int_arrays(number)
+    return np.asarray((abs(number - 100) <= 20) | (abs(number - 200) <= 20), dtype=bool)
+
+
+class Reference(NamedTuple):
+    """A batch reference answer and how to test against it."""
+
+    batch: Callable[..., np.ndarray]
+    edges: Callable[..., np.ndarray]  # inputs worth sampling first
+    generate: Callable[[np.random.Generator, int], Tuple[np.ndarray, ...]]
+
+
+def _pairs(rng: np.random.Generator, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Small values so that ties, zeros and sums of 20 actually occur.
+    return rng.integers(-300, 301, count), rng.integers(-300, 301, count)
+
+
+def _singles(rng: np.random.Generator, count: int) -> Tuple[np.ndarray]:
+    return (rng.integers(-100, 400, count),)
+
+
+def near(values: np.ndarray, *targets: int) -> np.ndarray:
+    """Mask of values within 1 of any target: the inputs off-by-ones hit."""
+    mask = np.zeros(values.shape, dtype=bool)
+    for target in targets:
+        mask |= abs(values - target) <= 1
+    return mask
+
+
+REFERENCES: Dict[str, Reference] = {
+    "check_negative_positive": Reference(
+        check_negative_positive_batch,
+        lambda a, b: near(a, 0) | near(b, 0),
+        _pairs,
+    ),
+    "compute_triple_sum": Reference(
+        compute_triple_sum_batch,
+        lambda a, b: abs(a - b) <= 1,
+        _pairs,
+    ),
+    "get_absolute_difference": Reference(
+        get_absolute_difference_batch,
+        lambda a, b: abs(a - b) <= 1,
+        _pairs,
+    ),
+    "check_sum_twenty": Reference(
+        check_sum_twenty_batch,
+        lambda a, b: near(a, 20) | near(b, 20) | near(a + b, 20),
+        _pairs,
+    ),
+    "is_within_twenty": Reference(
+        is_within_twenty_batch,
+        lambda n: near(n, 80, 120, 180, 220),
+        _singles,
+    ),
+}
+
+
+class Mismatch(NamedTuple):
+    """An input where a submission disagrees with the reference."""
+
+    args: tuple
+    expected: Any
+    actual: Any  # the return value, or "ExceptionName: message"
+
+
+class DifferentialReport(NamedTuple):
+    """Outcome of differential_test for one function."""
+
+    total: int  # inputs evaluated by the reference
+    checked: int  # inputs the student's function was called on
+    mismatches: List[Mismatch]
+
+    @property
+    def passed(self) -> bool:
+        return not self.mismatches
+
+
+def differential_test(
+    student: Callable[..., Any],
+    reference: Reference,
+    inputs: Sequence[np.ndarray],
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_mismatches: int = 20,
+    seed: int = 0,
+) -> DifferentialReport:
+    """
+    Compare a scalar submission with a batch reference.
+
+    The reference is evaluated on every input. The student's function is
+    called on up to ``sample_size`` randomly chosen inputs and up to as many
+    edge-case inputs (those marked by ``reference.edges``), with plain
+    Python values (``ndarray.tolist()``) as arguments.
+
+    Args:
+        student: The submitted scalar function
+        reference: Entry from REFERENCES (or a custom Reference)
+        inputs: One array per argument, all the same length
+        sample_size: Random and edge-case inputs to call the student on
+        max_mismatches: Stop after this many disagreements
+        seed: Seed for choosing the sample
+
+    Returns:
+        DifferentialReport with the disagreeing inputs
+    """
+    inputs = np.broadcast_arrays(*(np.asarray(array) for array in inputs))
+    expected = reference.batch(*inputs)
+    total = len(expected)
+    rng = np.random.default_rng(seed)
+
+    edges = np.flatnonzero(reference.edges(*inputs))
+    if len(edges) > sample_size:
+        edges = rng.choice(edges, sample_size, replace=False)
+    random_picks = rng.choice(total, min(sample_size, total), replace=False) if total else edges[:0]
+    sample = np.unique(np.concatenate([edges, random_picks]))
+
+    mismatches: List[Mismatch] = []
+    columns = [array[sample].tolist() for array in inputs]
+    wanted = expected[sample].tolist()
+    for args, want in zip(zip(*columns), wanted):
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                actual = student(*args)
+        except BaseException as exc:  # student code may raise anything, even SystemExit
+            actual = f"{type(exc).__name__}: {exc}"
+        if not _same(want, actual):
+            mismatches.append(Mismatch(args, want, actual))
+        if len(mismatches) >= max_mismatches:
+            break
+    return DifferentialReport(total, len(sample), mismatches)
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    # As in the grader: a bool answer must be a real bool, not 1 or 0.
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        return type(expected) is type(actual) and expected == actual
+    return type(actual) in (int, float) and expected == actual
+
+
+def _resolve(module: Any, name: str) -> Optional[Callable[..., Any]]:
+    target = module
+    for part in name.split("."):
+        target = getattr(target, part, None)
+        if target is None:
+            return None
+    return target
+
+
+def _check_functions(
+    connection: Optional[Connection],
+    path: str,
+    references: Dict[str, Reference],
+    count: int,
+    sample_size: int,
+    seed: int,
+    memory_mb: Optional[int],
+) -> Dict[str, Any]:
+    """
+    Import a submission and test each function, in a worker process.
+
+    Each function's result is sent over the connection as soon as it is
+    known, so the parent keeps what finished before a timeout or crash.
+    """
+    results: Dict[str, Any] = {}
+
+    def report(name: str, result: Dict[str, Any]) -> None:
+        results[name] = result
+        if connection is not None:
+            connection.send((name, result))
+
+    if connection is not None:
+        limit_memory(memory_mb)
+        sys.stdin = io.StringIO()
+    try:
+        spec = importlib.util.spec_from_file_location("_submission", path)
+        module = importlib.util.module_from_spec(spec)
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+    except BaseException as exc:  # a broken file, or sys.exit() at import time
+        error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        for name in references:
+            report(name, {"status": "error", "error": error})
+        return results
+
+    rng = np.random.default_rng(seed)
+    for name, reference in references.items():
+        student = _resolve(module, name)
+        if student is None:
+            report(name, {"status": "missing"})
+            continue
+        try:
+            outcome = differential_test(student, reference, reference.generate(rng, count), sample_size,
+                                        seed=seed)
+        except MemoryError:
+            report(name, {"status": "memory", "error": "exceeded memory limit"})
+            continue
+        report(name, {
+            "status": "ok" if outcome.passed else "mismatch",
+            "inputs": outcome.total,
+            "checked": outcome.checked,
+            "mismatches": [{"input": repr(m.args), "expected": repr(m.expected), "actual": repr(m.actual)}
+                           for m in outcome.mismatches],
+        })
+    return results
+
+
+def check_submission(
+    path: str,
+    references: Dict[str, Reference] = REFERENCES,
+    count: int = DEFAULT_INPUTS,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    seed: int = 0,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: Optional[int] = DEFAULT_MEMORY_MB,
+) -> Dict[str, Any]:
+    """
+    Differentially test every reference function found in a submission.
+
+    The submission is imported and called in a forked worker process. The
+    parent kills it once ``timeout`` seconds have passed; functions that
+    had not finished by then are reported as "timeout", and as "crashed" if
+    the worker died (``os._exit``, a segfault).
+
+    Args:
+        path: The student's file
+        references: Function name ("Class.method" for static methods) to Reference
+        count: Random inputs generated per function
+        sample_size: Random and edge-case inputs the student is called on
+        seed: Seed for the inputs and the sample
+        timeout: Seconds allowed for the whole submission; 0 for no limit
+        memory_mb: Address-space limit for the worker, or None for no limit
+
+    Returns:
+        JSON-ready report, one entry per function
+    """
+    if _FORK is None:
+        return _check_functions(None, path, references, count, sample_size, seed, memory_mb)
+
+    receiver, sender = _FORK.Pipe(duplex=False)
+    process = _FORK.Process(target=_check_functions,
+                            args=(sender, path, references, count, sample_size, seed, memory_mb), daemon=True)
+    process.start()
+    sender.close()
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+    results: Dict[str, Any] = {}
+    failure = None
+    try:
+        while len(results) < len(references):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not receiver.poll(remaining):
+                failure = {"status": "timeout", "error": f"exceeded {timeout:g}s; worker killed"}
+                break
+            try:
+                name, result = receiver.recv()
+            except EOFError:
+                process.join()
+                failure = {"status": "crashed", "error": f"worker process died (exit code {process.exitcode})"}
+                break
+            results[name] = result
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+    return {name: results.get(name, failure) for name in references}
+
+
+def _benchmark(references: Dict[str, Reference], scalars: Dict[str, Callable[..., Any]], count: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{count:,} inputs per function")
+    for name, reference in references.items():
+        inputs = reference.generate(rng, count)
+        started = time.perf_counter()
+        expected = reference.batch(*inputs)
+        batched = time.perf_counter() - started
+
+        scalar = scalars[name]
+        columns = [array.tolist() for array in inputs]
+        started = time.perf_counter()
+        looped = [scalar(*args) for args in zip(*columns)]
+        per_call = time.perf_counter() - started
+        assert looped == expected.tolist()
+        print(f"  {name:<40} batch {batched:6.3f}s   per call {per_call:6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential tests for practice-problems-4.py.")
+    parser.add_argument("submission", nargs="?", help="student file to test; omit to run the benchmark")
+    parser.add_argument("-n", "--inputs", type=int, default=DEFAULT_INPUTS,
+                        help="random inputs per function (default: %(default)s)")
+    parser.add_argument("--sample", type=int, default=DEFAULT_SAMPLE_SIZE,
+                        help="random and edge-case inputs to call the student on (default: %(default)s)")
+    options = parser.parse_args()
+
+    if options.submission:
+        results = check_submission(options.submission, REFERENCES, options.inputs, options.sample)
+        print(json.dumps(results, indent=2))
+        return
+
+    scalars = {name: globals()[name] for name in REFERENCES}
+    _benchmark(REFERENCES, scalars, options.inputs)
+
+    # An off-by-one a per-pair test on random inputs rarely hits.
+    def buggy_is_within_twenty(number):
+        return abs(number - 100) < 20 or abs(number - 200) < 20
+
+    inputs = _singles(np.random.default_rng(1), options.inputs)
+    started = time.perf_counter()
+    report = differential_test(buggy_is_within_twenty, REFERENCES["is_within_twenty"], inputs)
+    elapsed = time.perf_counter() - started
+    print(f"Differential test of a buggy is_within_twenty: {len(report.mismatches)} mismatches "
+          f"after {report.checked:,} student calls ({elapsed:.2f}s)")
+    for mismatch in report.mismatches[:4]:
+        print(f"    {mismatch.args} expected {mismatch.expected!r}, got {mismatch.actual!r}")
+
+
+if __name__ == "__main__":
+    main()
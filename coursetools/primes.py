@@ -0,0 +1,323 @@
+"""
+Prime engine behind Problem 26 (compute_prime_sum) and the is_prime helper
+from practice-problems-5.py.
+
+The engine is a segmented Sieve of Eratosthenes over odd numbers. The low end
+of the number line is kept as a cached bitmap so repeated queries are answered
+by lookup; anything beyond the cache is sieved one segment at a time so memory
+stays bounded. Numbers above the bitmap fall back to a deterministic
+Miller-Rabin test.
+
+Run ``python -m coursetools.primes`` for a benchmark against naive trial
+division.
+"""
+import math
+import time
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+# Witnesses that make Miller-Rabin deterministic for every n < 3.3 * 10**24,
+# which covers all 64-bit inputs.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Bounds for the first few primes, where the n(ln n + ln ln n) estimate
+# does not hold yet.
+_SMALL_NTH_PRIME_BOUNDS = (0, 2, 3, 5, 7, 11)
+
+
+def nth_prime_upper_bound(n: int) -> int:
+    """
+    Return an integer that is at least as large as the n-th prime.
+
+    Uses Rosser's bound p(n) < n(ln n + ln ln n), valid for n >= 6.
+
+    Args:
+        n: Position of the prime (1-based)
+
+    Returns:
+        Upper bound for the n-th prime
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    if n < len(_SMALL_NTH_PRIME_BOUNDS):
+        return _SMALL_NTH_PRIME_BOUNDS[n]
+    log_n = math.log(n)
+    return int(n * (log_n + math.log(log_n))) + 1
+
+
+def miller_rabin(number: int) -> bool:
+    """
+    Deterministic Miller-Rabin primality test.
+
+    The result is exact for every number below 3.3 * 10**24 (so for all
+    64-bit inputs); above that it is a strong probable-prime test.
+
+    Args:
+        number: Number to check for primality
+
+    Returns:
+        True if the number is prime, False otherwise
+    """
+    if number < 2:
+        return False
+    for p in MILLER_RABIN_BASES:
+        if number % p == 0:
+            return number == p
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def trial_division_is_prime(number: int) -> bool:
+    """
+    Naive per-number primality check, as students usually write it.
+
+    Kept as the baseline for the benchmark.
+    """
+    if number < 2:
+        return False
+    if number % 2 == 0:
+        return number == 2
+    divisor = 3
+    while divisor * divisor <= number:
+        if number % divisor == 0:
+            return False
+        divisor += 2
+    return True
+
+
+def trial_division_prime_sum(n: int, deadline: Optional[float] = None) -> Optional[int]:
+    """
+    Sum the first n primes with trial division.
+
+    Args:
+        n: Number of primes to sum
+        deadline: Optional ``time.perf_counter()`` value after which to give up
+
+    Returns:
+        The sum, or None if the deadline passed first
+    """
+    total = 0
+    found = 0
+    candidate = 2
+    while found < n:
+        if trial_division_is_prime(candidate):
+            total += candidate
+            found += 1
+            if deadline is not None and found % 1000 == 0 and time.perf_counter() > deadline:
+                return None
+        candidate += 1
+    return total
+
+
+class PrimeSieve:
+    """
+    Cached, segmented Sieve of Eratosthenes.
+
+    Only odd numbers are stored: index i of a bitmap stands for 2i + 1. The
+    first ``cache_limit`` numbers are kept in memory once sieved; work beyond
+    that is done in segments of ``segment_size`` odd numbers and discarded.
+    """
+
+    def __init__(self, segment_size: int = 1 << 21, cache_limit: int = 1 << 26):
+        if segment_size < 1:
+            raise ValueError("segment_size must be positive")
+        self.segment_size = segment_size
+        self.cache_limit = cache_limit
+        self._bitmap = np.zeros(0, dtype=bool)
+        self._base_primes = np.zeros(0, dtype=np.int64)
+        self._base_limit = 1
+
+    @property
+    def cached_limit(self) -> int:
+        """Numbers below this value can be answered from the bitmap."""
+        return 2 * len(self._bitmap)
+
+    def _ensure_base_primes(self, limit: int) -> np.ndarray:
+        """Return the odd primes p with p * p < limit."""
+        root = math.isqrt(max(limit - 1, 0)) + 1
+        if root > self._base_limit:
+            root = max(root, 2 * self._base_limit)
+            flags = np.ones(root // 2, dtype=bool)
+            flags[0] = False
+            for i in range(1, (math.isqrt(root) - 1) // 2 + 1):
+                if flags[i]:
+                    p = 2 * i + 1
+                    flags[p * p // 2::p] = False
+            self._base_primes = 2 * np.flatnonzero(flags).astype(np.int64) + 1
+            self._base_limit = 2 * len(flags)
+        return self._base_primes
+
+    def _sieve_segment(self, low: int, high: int) -> np.ndarray:
+        """Sieve the odd-number indices [low, high) and return the flags."""
+        flags = np.ones(high - low, dtype=bool)
+        if low == 0:
+            flags[0] = False
+        first_number = 2 * low + 1
+        for p in self._ensure_base_primes(2 * high).tolist():
+            start = max(p * p, (first_number + p - 1) // p * p)
+            if start % 2 == 0:
+                start += p
+            offset = start // 2 - low
+            if offset >= len(flags):
+                continue
+            flags[offset::p] = False
+        return flags
+
+    def extend(self, limit: int) -> None:
+        """
+        Grow the cached bitmap so it covers every number below ``limit``.
+
+        Growth stops at ``cache_limit``.
+        """
+        target = (min(limit, self.cache_limit) + 1) // 2
+        chunks = [self._bitmap]
+        covered = len(self._bitmap)
+        while covered < target:
+            high = min(covered + self.segment_size, target)
+            chunks.append(self._sieve_segment(covered, high))
+            covered = high
+        if len(chunks) > 1:
+            self._bitmap = np.concatenate(chunks)
+
+    def iter_segments(self, limit: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield the odd primes below ``limit`` in ascending blocks.
+
+        Blocks inside the cache are sliced out of the bitmap; the rest are
+        sieved on the fly.
+
+        Yields:
+            (low, primes) where primes is an int64 array of odd primes
+        """
+        end = (limit + 1) // 2
+        self.extend(limit)
+        low = 0
+        while low < end:
+            high = min(low + self.segment_size, end)
+            if high <= len(self._bitmap):
+                flags = self._bitmap[low:high]
+            else:
+                flags = self._sieve_segment(low, high)
+            yield low, 2 * (np.flatnonzero(flags).astype(np.int64) + low) + 1
+            low = high
+
+    def is_prime(self, number: int) -> bool:
+        """
+        Check if a number is prime.
+
+        Answers from the sieve bitmap when the number is cached, otherwise
+        falls back to Miller-Rabin.
+
+        Args:
+            number: Number to check for primality
+
+        Returns:
+            True if the number is prime, False otherwise
+        """
+        if number < 2:
+            return False
+        if number % 2 == 0:
+            return number == 2
+        if number < self.cached_limit:
+            return bool(self._bitmap[number // 2])
+        return miller_rabin(number)
+
+    def prime_sum(self, n: int) -> int:
+        """
+        Compute the sum of the first n prime numbers.
+
+        Args:
+            n: Number of primes to sum
+
+        Returns:
+            Sum of the first n primes
+        """
+        if n < 0:
+            raise ValueError("n must not be negative")
+        if n == 0:
+            return 0
+        total = 2
+        remaining = n - 1
+        for _, primes in self.iter_segments(nth_prime_upper_bound(n) + 1):
+            if remaining == 0:
+                break
+            taken = primes[:remaining]
+            # int64 is safe per block: a block's sum stays far below 2**63.
+            total += int(taken.sum())
+            remaining -= len(taken)
+        return total
+
+
+_default_sieve = PrimeSieve()
+
+
+def is_prime(number: int) -> bool:
+    """
+    Helper method: Check if a number is prime.
+
+    Uses the shared module-level sieve, so lookups get faster once
+    compute_prime_sum has warmed the cache.
+
+    Args:
+        number: Number to check for primality
+
+    Returns:
+        True if the number is prime, False otherwise
+    """
+    return _default_sieve.is_prime(number)
+
+
+def compute_prime_sum(n: int = 500) -> int:
+    """
+    Problem 26: Compute the sum of the first n prime numbers.
+
+    Example:
+        Input: 500
+        Output: 824693
+
+    Args:
+        n: Number of primes to sum (practical up to 10**8)
+
+    Returns:
+        Sum of the first n prime numbers
+    """
+    return _default_sieve.prime_sum(n)
+
+
+def main():
+    sizes = [500, 10**5, 10**7]
+    naive_budget = 30.0
+    print(f"{'n':>10}  {'sieve (s)':>10}  {'naive (s)':>12}  sum")
+    for n in sizes:
+        start = time.perf_counter()
+        total = PrimeSieve().prime_sum(n)
+        sieve_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        naive_total = trial_division_prime_sum(n, deadline=start + naive_budget)
+        naive_time = time.perf_counter() - start
+        if naive_total is None:
+            naive = f">{naive_budget:.0f} (gave up)"
+        else:
+            assert naive_total == total, (n, naive_total, total)
+            naive = f"{naive_time:.4f}"
+        print(f"{n:>10}  {sieve_time:>10.4f}  {naive:>12}  {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Reference answer for LongestSubstringLength, the second C# problem in
+practice-problems-other.py.
+
+The answer is a sliding window: the window ending at position i starts
+just after the previous occurrence of any character in it, so
+
+    start[i] = max(start[i - 1], previous[i] + 1)
+
+For bytes and ASCII text this runs block by block in NumPy. A stable sort
+of each block groups equal bytes, which gives every byte's previous
+occurrence inside the block, and a 256-entry last-seen index array fills
+in occurrences from earlier blocks. ``np.maximum.accumulate`` then carries
+the window start. General Unicode text uses the classic loop with a dict
+of last-seen positions.
+"""
+import random
+import string
+import time
+from typing import Union
+
+import numpy as np
+
+# Bytes handled per NumPy step; the temporaries are a few int64 per byte.
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+Text = Union[str, bytes, bytearray, memoryview]
+
+
+def longest_substring_length(s: Text, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    """
+    Problem: Find the length of the longest substring without repeating characters.
+
+    Example:
+    Input: "abcabcbb"
+    Output: 3 (The longest substring is "abc")
+
+    Parameters:
+        s (str): Input string (bytes-like input is compared byte by byte)
+        block_size (int): Bytes handled per NumPy step
+    Returns:
+        int: Length of the longest substring without repeating characters
+    """
+    if isinstance(s, str):
+        if not s.isascii():
+            return _longest_unicode(s)
+        s = s.encode("ascii")
+    return _longest_bytes(np.frombuffer(s, dtype=np.uint8), block_size)
+
+
+def _longest_unicode(s: str) -> int:
+    last_seen = {}
+    start = best = 0
+    for index, char in enumerate(s):
+        previous = last_seen.get(char, -1)
+        if previous >= start:
+            start = previous + 1
+        last_seen[char] = index
+        if index - start >= best:
+            best = index - start + 1
+    return best
+
+
+def _longest_bytes(data: np.ndarray, block_size: int) -> int:
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+    last_seen = np.full(256, -1, dtype=np.int64)
+    window_start = 0
+    best = 0
+    for offset in range(0, len(data), block_size):
+        block = data[offset:offset + block_size]
+        # Stable sort: equal bytes end up adjacent, in position order.
+        order = np.argsort(block, kind="stable")
+        values = block[order]
+        positions = order + offset
+        same = values[1:] == values[:-1]
+
+        previous_sorted = last_seen[values]
+        previous_sorted[1:][same] = positions[:-1][same]
+        previous = np.empty_like(previous_sorted)
+        previous[order] = previous_sorted
+
+        starts = np.maximum.accumulate(np.maximum(previous + 1, window_start))
+        lengths = np.arange(offset + 1, offset + len(block) + 1) - starts
+        best = max(best, int(lengths.max()))
+        window_start = int(starts[-1])
+
+        group_ends = np.flatnonzero(np.append(~same, True))
+        last_seen[values[group_ends]] = positions[group_ends]
+    return best
+
+
+# Example usage: 10^7 characters
+def main():
+    count = 10_000_000
+    ascii_text = "".join(random.choices(string.ascii_letters + string.digits, k=count))
+    unicode_text = "".join(random.choices(string.ascii_letters + "αβγδεζηθλμ", k=count))
+    expected = _longest_unicode(ascii_text)
+
+    started = time.perf_counter()
+    assert longest_substring_length(ascii_text) == expected
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _longest_unicode(ascii_text)
+    looped = time.perf_counter() - started
+
+    started = time.perf_counter()
+    longest_substring_length(unicode_text)
+    unicode = time.perf_counter() - started
+
+    print(f"{count:,} characters, longest run without repeats: {expected}")
+    print(f"  ASCII, last-seen array (NumPy): {vectorized:.2f}s")
+    print(f"  ASCII, dict loop:               {looped:.2f}s")
+    print(f"  Unicode, dict loop:             {unicode:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
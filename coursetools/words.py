@@ -0,0 +1,263 @@
+"""
+Reference answer for reverse_words in practice-problems-6.py, plus a
+streaming version for texts too large to split in memory.
+
+Words are runs of non-whitespace. Their order is reversed while every
+whitespace run stays where it was, so "a  b c" becomes "c  b a". The
+streaming version finds the word boundaries in one pass and keeps only
+their offsets (two ``array('q')`` entries per word), so memory grows with
+the number of words rather than with copies of the text. The output pieces
+(words and the whitespace between them) are then laid out for
+DEFAULT_PIECE_GROUP words at a time, and the reversed text is written to an
+output stream or a preallocated buffer a block at a time; for ``bytes`` and
+memory-mapped files each block is one NumPy gather from the input.
+"""
+import io
+import mmap
+import os
+import random
+import re
+import tempfile
+import time
+from array import array
+from typing import Any, Iterator, Tuple, Union
+
+import numpy as np
+
+# Characters of output assembled per write.
+DEFAULT_WRITE_SIZE = 1 << 20
+
+# Bytes classified as space / non-space per step when finding words.
+DEFAULT_SCAN_SIZE = 1 << 24
+
+# Words whose output pieces are laid out at a time.
+DEFAULT_PIECE_GROUP = 1 << 16
+
+_WORD = re.compile(r"\S+")
+
+# ASCII whitespace, the separators of bytes.split().
+_SPACE = np.zeros(256, dtype=bool)
+_SPACE[list(b" \t\n\r\x0b\x0c")] = True
+
+Text = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+
+def reverse_words(sentence: str) -> str:
+    """
+    Problem 28: Reverse the words of a sentence.
+
+    Example:
+        Input: "Display the pattern like pyramid using the alphabet."
+        Output: "alphabet. the using pyramid like pattern the Display"
+
+    Args:
+        sentence: The input sentence to reverse
+
+    Returns:
+        String with words in reverse order
+    """
+    out = io.StringIO()
+    write_reversed_words(sentence, out)
+    return out.getvalue()
+
+
+def find_words(text: Text, scan_size: int = DEFAULT_SCAN_SIZE) -> Tuple[array, array]:
+    """
+    Find the start and end offset of every word in one pass.
+
+    Bytes-like input is scanned ``scan_size`` bytes at a time with NumPy, so
+    the only full-length data is the input itself. Whitespace is ASCII
+    whitespace, as for ``bytes.split()``.
+
+    Args:
+        text: str, or bytes-like (including ``mmap.mmap``)
+        scan_size: Bytes classified per step for bytes-like input
+
+    Returns:
+        (starts, ends) as ``array('q')``, one entry per word
+    """
+    starts = array("q")
+    ends = array("q")
+    if isinstance(text, str):
+        add_start = starts.append
+        add_end = ends.append
+        for match in _WORD.finditer(text):
+            start, end = match.span()
+            add_start(start)
+            add_end(end)
+        return starts, ends
+
+    data = np.frombuffer(text, dtype=np.uint8)
+    previous_space = True
+    for offset in range(0, len(data), scan_size):
+        space = _SPACE[data[offset:offset + scan_size]]
+        changed = np.empty(len(space), dtype=bool)
+        changed[0] = space[0] != previous_space
+        np.not_equal(space[1:], space[:-1], out=changed[1:])
+        edges = np.flatnonzero(changed)
+        word_start = ~space[edges]
+        edges += offset
+        starts.frombytes(edges[word_start].astype(np.int64).tobytes())
+        ends.frombytes(edges[~word_start].astype(np.int64).tobytes())
+        previous_space = bool(space[-1])
+    if not previous_space:
+        ends.append(len(data))
+    return starts, ends
+
+
+def _pieces(starts: array, ends: array, length: int,
+            group: int = DEFAULT_PIECE_GROUP) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Offsets and lengths of the output pieces, in output order: the leading
+    whitespace, then the last word, the first gap, the second-to-last word,
+    the second gap, ..., the first word and the trailing whitespace.
+
+    The pieces come ``group`` words at a time, so besides the word offsets
+    only one group's arrays exist at once.
+    """
+    word_starts = np.frombuffer(starts, dtype=np.int64)
+    word_ends = np.frombuffer(ends, dtype=np.int64)
+    count = len(word_starts)
+    if not count:
+        yield np.zeros(1, np.int64), np.full(1, length, np.int64)
+        return
+    yield np.zeros(1, np.int64), word_starts[:1].copy()
+    for first in range(0, count, group):
+        last = min(first + group, count)
+        # Piece pair k is word count - 1 - k, then the whitespace after word k.
+        words = slice(count - last, count - first)
+        offsets = np.empty(2 * (last - first), dtype=np.int64)
+        lengths = np.empty_like(offsets)
+        offsets[0::2] = word_starts[words][::-1]
+        lengths[0::2] = (word_ends[words] - word_starts[words])[::-1]
+        gap_ends = word_starts[first + 1:last + 1]
+        if last == count:
+            gap_ends = np.append(gap_ends, length)
+        offsets[1::2] = word_ends[first:last]
+        lengths[1::2] = gap_ends - word_ends[first:last]
+        yield offsets, lengths
+
+
+def write_reversed_words(text: Text, out: Any, write_size: int = DEFAULT_WRITE_SIZE) -> int:
+    """
+    Write ``text`` with its words reversed and its whitespace kept in place.
+
+    For bytes-like input, consecutive pieces are gathered with one NumPy
+    take per ``write_size`` bytes of output; a piece longer than that is
+    written as a slice of the input.
+
+    Args:
+        text: str, or bytes-like (including ``mmap.mmap``)
+        out: Stream with a ``write`` method (text or binary to match
+            ``text``), or a writable buffer at least ``len(text)`` long
+        write_size: Characters gathered before each write
+
+    Returns:
+        Number of characters (or bytes) written, always ``len(text)``
+    """
+    if isinstance(text, str):
+        if not hasattr(out, "write"):
+            raise TypeError("str input needs an output stream, not a buffer")
+        pieces = []
+        pending = 0
+        for offsets, lengths in _pieces(*find_words(text), len(text)):
+            for offset, length in zip(offsets.tolist(), lengths.tolist()):
+                pieces.append(text[offset:offset + length])
+                pending += length
+                if pending >= write_size:
+                    out.write("".join(pieces))
+                    pieces.clear()
+                    pending = 0
+        if pieces:
+            out.write("".join(pieces))
+        return len(text)
+
+    data = np.frombuffer(text, dtype=np.uint8)
+    target = None
+    if not hasattr(out, "write"):
+        target = np.frombuffer(out, dtype=np.uint8)
+        if len(target) < len(data):
+            raise ValueError(f"output buffer holds {len(target)} bytes, need {len(data)}")
+    written = 0
+    for offsets, lengths in _pieces(*find_words(text), len(data)):
+        # Output position at the end of each piece.
+        positions = np.cumsum(lengths)
+        positions += written
+        first = 0
+        while first < len(offsets):
+            last = max(first + 1, int(np.searchsorted(positions, written + write_size, side="right")))
+            size = int(positions[last - 1]) - written
+            if last == first + 1:
+                block = data[offsets[first]:offsets[first] + size]
+            else:
+                # Index of every output byte in the block: each piece's offset,
+                # repeated over its length, plus a running count.
+                shift = offsets[first:last] - (positions[first:last] - lengths[first:last] - written)
+                index = np.repeat(shift, lengths[first:last]) + np.arange(size)
+                block = data[index]
+            if target is None:
+                out.write(block)
+            else:
+                target[written:written + size] = block
+            written += size
+            first = last
+    return written
+
+
+def reverse_words_file(path: str, out: Any, write_size: int = DEFAULT_WRITE_SIZE) -> int:
+    """
+    Reverse the words of a file, memory-mapping it rather than reading it.
+
+    Args:
+        path: File to read
+        out: Binary stream, or a writable buffer at least as long as the file
+        write_size: Bytes gathered before each write to a stream
+
+    Returns:
+        Number of bytes written
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return write_reversed_words(mapped, out, write_size)
+
+
+# Example usage: throughput on a generated ~100 MB text file
+def main():
+    vocabulary = [word.encode() for word in
+                  "Display the pattern like pyramid using the alphabet. Preserve spacing, please!".split()]
+    spaces = [b" "] * 8 + [b"  ", b"\n", b"\t"]
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, "words.txt")
+        with open(path, "wb") as f:
+            for _ in range(100):
+                f.write(b"".join(random.choice(vocabulary) + random.choice(spaces) for _ in range(100_000)))
+        size = os.path.getsize(path)
+        megabytes = size / 1e6
+
+        started = time.perf_counter()
+        with open(path, "rb") as f:
+            data = f.read()
+        " ".join(data.decode().split()[::-1])
+        naive = time.perf_counter() - started
+        del data
+
+        started = time.perf_counter()
+        with open(os.devnull, "wb") as sink:
+            reverse_words_file(path, sink)
+        streamed = time.perf_counter() - started
+
+        result = bytearray(size)
+        started = time.perf_counter()
+        reverse_words_file(path, result)
+        buffered = time.perf_counter() - started
+
+    print(f"{megabytes:.0f} MB, 10,000,000 words")
+    print(f"split/join (loses spacing):   {megabytes / naive:6.1f} MB/s")
+    print(f"reverse_words_file -> stream: {megabytes / streamed:6.1f} MB/s")
+    print(f"reverse_words_file -> buffer: {megabytes / buffered:6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()